@@ -0,0 +1,27 @@
+# Generated by Django 6.0 on 2026-10-15 06:59
+
+from django.conf import settings
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("entries", "0012_insulinschedule_last_modified_by"),
+        migrations.swappable_dependency(settings.AUTH_USER_MODEL),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name="glucosereading",
+            index=models.Index(
+                fields=["-occurred_at"], name="entries_glu_occurre_7bc059_idx"
+            ),
+        ),
+        migrations.AddIndex(
+            model_name="meal",
+            index=models.Index(
+                fields=["-occurred_at"], name="entries_mea_occurre_541c0a_idx"
+            ),
+        ),
+    ]
@@ -0,0 +1,27 @@
+# Generated by Django 6.0 on 2026-10-15 07:21
+
+from django.conf import settings
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("entries", "0013_glucosereading_entries_glu_occurre_7bc059_idx_and_more"),
+        migrations.swappable_dependency(settings.AUTH_USER_MODEL),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name="correctionscale",
+            index=models.Index(
+                fields=["greater_than"], name="entries_cor_greater_85fb47_idx"
+            ),
+        ),
+        migrations.AddIndex(
+            model_name="insulindose",
+            index=models.Index(
+                fields=["-occurred_at"], name="entries_ins_occurre_08d8e8_idx"
+            ),
+        ),
+    ]
@@ -65,7 +65,10 @@ class GlucoseReading(AutoLastModifiedMixin, TimestampedModel):
 
     class Meta:  # type: ignore[misc]
         ordering = ["-occurred_at"]
-        indexes = [models.Index(fields=["last_modified_by", "-occurred_at"])]
+        indexes = [
+            models.Index(fields=["last_modified_by", "-occurred_at"]),
+            models.Index(fields=["-occurred_at"]),
+        ]
 
     def __str__(self):
         return f"{self.value} {self.unit} at {self.occurred_at}"
@@ -92,7 +95,10 @@ class InsulinDose(AutoLastModifiedMixin, TimestampedModel):
 
     class Meta:  # type: ignore[misc]
         ordering = ["-occurred_at"]
-        indexes = [models.Index(fields=["last_modified_by", "-occurred_at"])]
+        indexes = [
+            models.Index(fields=["last_modified_by", "-occurred_at"]),
+            models.Index(fields=["-occurred_at"]),
+        ]
 
     def __str__(self):
         total = self.base_units + self.correction_units
@@ -130,7 +136,10 @@ class Meal(AutoLastModifiedMixin, TimestampedModel):
 
     class Meta:  # type: ignore[misc]
         ordering = ["-occurred_at"]
-        indexes = [models.Index(fields=["last_modified_by", "-occurred_at"])]
+        indexes = [
+            models.Index(fields=["last_modified_by", "-occurred_at"]),
+            models.Index(fields=["-occurred_at"]),
+        ]
 
     def __str__(self):
         return f"{self.get_meal_type_display()} at {self.occurred_at}"  # type: ignore[misc]
@@ -182,6 +191,7 @@ class CorrectionScale(TimestampedModel):
 
     class Meta:  # type: ignore[misc]
         ordering = ["greater_than"]
+        indexes = [models.Index(fields=["greater_than"])]
 
     def __str__(self):
         return f"Above {self.greater_than}: +{self.units_to_add} units"
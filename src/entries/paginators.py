@@ -0,0 +1,78 @@
+"""Paginators for entries app."""
+
+import hashlib
+import time
+
+from django.core.cache import DEFAULT_CACHE_ALIAS, cache, caches
+from django.core.cache.backends.locmem import LocMemCache
+from django.core.exceptions import EmptyResultSet
+from django.core.paginator import Paginator
+from django.utils.functional import cached_property
+
+CACHE_PREFIX = "entries:paginator-count"
+
+
+def _cache_is_shared():
+    """
+    Return whether the default cache is shared between processes.
+
+    A local-memory cache only sees invalidations made in its own process, so
+    other gunicorn workers and management commands would keep serving a stale
+    count.
+    """
+    return not isinstance(caches[DEFAULT_CACHE_ALIAS], LocMemCache)
+
+
+def _generation_key(model):
+    return f"{CACHE_PREFIX}:{model._meta.label_lower}:generation"
+
+
+def get_count_generation(model):
+    """Return the current count-cache generation for a model."""
+    return cache.get_or_set(_generation_key(model), time.time_ns, None)
+
+
+def invalidate_count_cache(model):
+    """Invalidate all cached paginator counts for a model."""
+    cache.set(_generation_key(model), time.time_ns(), None)
+
+
+class CachingPaginator(Paginator):
+    """
+    Paginator that caches the object count of a queryset.
+
+    Counts are keyed by the model, its current cache generation and a hash of
+    the compiled SQL (which includes any filters), so different filters never
+    share a count. Saving or deleting an instance bumps the generation, see
+    entries.signals. Counts are only cached when the default cache is shared
+    between processes; with the local-memory cache every page counts directly.
+    """
+
+    cache_timeout = 60
+
+    def _count_cache_key(self):
+        if not _cache_is_shared():
+            return None
+        query = getattr(self.object_list, "query", None)
+        if query is None:
+            return None
+        try:
+            sql = str(query)
+        except EmptyResultSet:
+            return None
+        model = self.object_list.model
+        generation = get_count_generation(model)
+        digest = hashlib.md5(sql.encode(), usedforsecurity=False).hexdigest()
+        return f"{CACHE_PREFIX}:{model._meta.label_lower}:{generation}:{digest}"
+
+    @cached_property
+    def count(self):
+        """Return the total number of objects, using the cache when possible."""
+        key = self._count_cache_key()
+        if key is None:
+            return super().count
+        count = cache.get(key)
+        if count is None:
+            count = super().count
+            cache.set(key, count, self.cache_timeout)
+        return count
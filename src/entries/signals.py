@@ -0,0 +1,22 @@
+"""Signal handlers for entries app."""
+
+from django.db import transaction
+from django.db.models.signals import post_delete, post_save
+from django.dispatch import receiver
+
+from .models import GlucoseReading, Meal
+from .paginators import invalidate_count_cache
+
+
+@receiver(post_save, sender=GlucoseReading)
+@receiver(post_delete, sender=GlucoseReading)
+@receiver(post_save, sender=Meal)
+@receiver(post_delete, sender=Meal)
+def invalidate_paginator_counts(sender, **kwargs):
+    """
+    Invalidate cached list counts when an entry is added, changed or removed.
+
+    Invalidation waits for the commit, otherwise a request in between could
+    cache the old count under the new generation.
+    """
+    transaction.on_commit(lambda: invalidate_count_cache(sender))
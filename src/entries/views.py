@@ -17,6 +17,7 @@ from .forms import (
     MealForm,
 )
 from .models import CorrectionScale, GlucoseReading, InsulinDose, InsulinSchedule, Meal
+from .paginators import CachingPaginator
 from .utils import get_date_filters
 
 
@@ -179,29 +180,41 @@ def glucose_readings_list(request):
         elif export_format == "text":
             return exporter.to_text()
 
-    # Paginate
-    paginator = Paginator(readings, page_size)
+    # Paginate, loading only the columns the list renders
+    paginator = CachingPaginator(
+        readings.only(
+            "occurred_at",
+            "value",
+            "unit",
+            "last_modified_by__first_name",
+            "last_modified_by__last_name",
+            "last_modified_by__email",
+        ),
+        page_size,
+    )
     page_number = request.GET.get("page", 1)
     page_obj = paginator.get_page(page_number)
 
     # Prepare chart data (all readings, not just paginated)
-    chart_readings = readings.order_by("occurred_at")  # Always chronological for charts
+    chart_readings = readings.order_by("occurred_at").values_list(
+        "occurred_at", "value"
+    )  # Always chronological for charts
     chart_data = []
     daily_data = {}  # For 24-hour overlay chart
     daily_averages = {}  # For daily averages chart
 
-    for reading in chart_readings:
+    for occurred_at, value in chart_readings:
         # For timeline chart
         chart_data.append(
             {
-                "timestamp": reading.occurred_at.isoformat(),
-                "value": float(reading.value),
+                "timestamp": occurred_at.isoformat(),
+                "value": float(value),
             }
         )
 
         # For 24-hour overlay chart
-        date_key = reading.occurred_at.date().isoformat()
-        time_key = reading.occurred_at.strftime("%H:%M")
+        date_key = occurred_at.date().isoformat()
+        time_key = occurred_at.strftime("%H:%M")
 
         if date_key not in daily_data:
             daily_data[date_key] = []
@@ -209,16 +222,15 @@ def glucose_readings_list(request):
         daily_data[date_key].append(
             {
                 "time": time_key,
-                "hour_decimal": reading.occurred_at.hour
-                + reading.occurred_at.minute / 60,
-                "value": float(reading.value),
+                "hour_decimal": occurred_at.hour + occurred_at.minute / 60,
+                "value": float(value),
             }
         )
 
         # For daily averages chart
         if date_key not in daily_averages:
             daily_averages[date_key] = []
-        daily_averages[date_key].append(float(reading.value))
+        daily_averages[date_key].append(float(value))
 
     # Calculate averages for each day
     daily_avg_data = [
@@ -333,8 +345,19 @@ def meals_list(request):
     if end_datetime:
         meals = meals.filter(occurred_at__lte=end_datetime)
 
-    # Paginate
-    paginator = Paginator(meals, page_size)
+    # Paginate, loading only the columns the list renders
+    paginator = CachingPaginator(
+        meals.only(
+            "occurred_at",
+            "meal_type",
+            "description",
+            "total_carbs",
+            "last_modified_by__first_name",
+            "last_modified_by__last_name",
+            "last_modified_by__email",
+        ),
+        page_size,
+    )
     page_number = request.GET.get("page", 1)
     page_obj = paginator.get_page(page_number)
 
@@ -442,8 +465,20 @@ def insulin_doses_list(request):
     if end_datetime:
         doses = doses.filter(occurred_at__lte=end_datetime)
 
-    # Paginate
-    paginator = Paginator(doses, page_size)
+    # Paginate, loading only the columns the list renders
+    paginator = Paginator(
+        doses.only(
+            "occurred_at",
+            "base_units",
+            "correction_units",
+            "insulin_type__name",
+            "insulin_type__type",
+            "last_modified_by__first_name",
+            "last_modified_by__last_name",
+            "last_modified_by__email",
+        ),
+        page_size,
+    )
     page_number = request.GET.get("page", 1)
     page_obj = paginator.get_page(page_number)
 
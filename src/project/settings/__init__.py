@@ -5,5 +5,6 @@ from .server import *
 from .auth import *
 from .middleware import *
 from .db import *
+from .cache import *
 from .locale import *
 from .assets import *
@@ -0,0 +1,12 @@
+"""
+Cache configuration.
+"""
+
+from .environment import env
+
+# Local-memory cache by default. It is per-process, so list counts are not
+# cached with it (see entries.paginators). Set CACHE_URL to a shared cache
+# (e.g. redis://host:6379/1) to cache them across gunicorn workers.
+CACHES = {
+    "default": env.cache("CACHE_URL", default="locmemcache://"),
+}
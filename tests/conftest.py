@@ -3,11 +3,38 @@ Pytest configuration and fixtures for the project.
 """
 import pytest
 from django.contrib.auth import get_user_model
+from django.core.cache import cache
 from entries.models import InsulinType
 
 User = get_user_model()
 
 
+@pytest.fixture(autouse=True)
+def local_cache(settings):
+    """Use a per-process cache, whatever CACHE_URL is set to in .env."""
+    settings.CACHES = {
+        'default': {'BACKEND': 'django.core.cache.backends.locmem.LocMemCache'},
+    }
+
+
+@pytest.fixture(autouse=True)
+def clear_cache(local_cache):
+    """Clear the cache so cached values don't leak between tests."""
+    cache.clear()
+
+
+@pytest.fixture(autouse=True)
+def fast_password_hasher(settings):
+    """Use a fast password hasher; PBKDF2 dominates user fixture setup."""
+    settings.PASSWORD_HASHERS = ['django.contrib.auth.hashers.MD5PasswordHasher']
+
+
+@pytest.fixture(autouse=True)
+def cookie_sessions(settings):
+    """Keep sessions in signed cookies so logins don't write session rows."""
+    settings.SESSION_ENGINE = 'django.contrib.sessions.backends.signed_cookies'
+
+
 @pytest.fixture
 def user_data():
     """Sample user data for testing."""
@@ -30,6 +57,16 @@ def user(db, user_data):
     )
 
 
+@pytest.fixture
+def unsaved_user(user_data):
+    """Build a test user in memory without touching the database."""
+    return User(
+        email=user_data['email'],
+        first_name=user_data['first_name'],
+        last_name=user_data['last_name'],
+    )
+
+
 @pytest.fixture
 def second_user(db):
     """Create a second test user."""
@@ -1,9 +1,24 @@
 """Fixtures for entries app tests."""
 import pytest
-from entries.models import InsulinType
+from decimal import Decimal
+from django.utils import timezone
+from entries.models import GlucoseReading, InsulinType
 from base.middleware import set_current_user
 
 
+@pytest.fixture(scope="session")
+def now_str():
+    """Return the current time formatted for datetime-local form fields."""
+    return timezone.now().replace(tzinfo=None).isoformat(timespec="minutes")
+
+
+@pytest.fixture
+def auth_client(client, user):
+    """Return the test client logged in as the test user."""
+    client.force_login(user)
+    return client
+
+
 @pytest.fixture
 def insulin_type(user):
     """Create a test insulin type."""
@@ -15,3 +30,18 @@ def insulin_type(user):
     )
     set_current_user(None)
     return insulin_type
+
+
+@pytest.fixture
+def three_day_readings(user):
+    """Create glucose readings from 5, 3 and 1 days ago, oldest first."""
+    now = timezone.now()
+    return GlucoseReading.objects.bulk_create([
+        GlucoseReading(
+            occurred_at=now - timezone.timedelta(days=days),
+            value=value,
+            unit="mmol/L",
+            last_modified_by=user
+        )
+        for days, value in ((5, Decimal("5.0")), (3, Decimal("5.5")), (1, Decimal("6.0")))
+    ])
@@ -1,6 +1,8 @@
 """Tests for entries models."""
+import time
 import pytest
 from decimal import Decimal
+from django.db import connection
 from django.utils import timezone
 
 from entries.models import CorrectionScale, GlucoseReading, InsulinDose, InsulinType, Meal
@@ -145,6 +147,20 @@ class TestGlucoseReading:
         assert reading_mmol.unit == "mmol/L"
         assert reading_mgdl.unit == "mg/dL"
 
+    @pytest.mark.django_db
+    @pytest.mark.skipif(connection.vendor != "sqlite", reason="Checks SQLite query plan")
+    def test_date_range_uses_occurred_at_index(self):
+        """Test that date-filtered lists are served by the occurred_at index."""
+        now = timezone.now()
+        readings = GlucoseReading.objects.filter(
+            occurred_at__gte=now - timezone.timedelta(days=1),
+            occurred_at__lte=now,
+        ).order_by("-occurred_at")
+
+        plan = readings.explain()
+        assert "entries_glu_occurre_7bc059_idx" in plan
+        assert "TEMP B-TREE" not in plan
+
 
 class TestInsulinDose:
     """Tests for InsulinDose model."""
@@ -199,6 +215,14 @@ class TestInsulinDose:
         
         set_current_user(None)
 
+    @pytest.mark.django_db
+    @pytest.mark.skipif(connection.vendor != "sqlite", reason="Checks SQLite query plan")
+    def test_list_ordering_uses_occurred_at_index(self):
+        """Test that the newest-first dose list is served by the occurred_at index."""
+        plan = InsulinDose.objects.order_by("-occurred_at")[:50].explain()
+        assert "entries_ins_occurre_08d8e8_idx" in plan
+        assert "TEMP B-TREE" not in plan
+
 
 class TestMeal:
     """Tests for Meal model."""
@@ -288,6 +312,20 @@ class TestMeal:
         
         assert meal.total_carbs is None
 
+    @pytest.mark.django_db
+    @pytest.mark.skipif(connection.vendor != "sqlite", reason="Checks SQLite query plan")
+    def test_date_range_uses_occurred_at_index(self):
+        """Test that date-filtered lists are served by the occurred_at index."""
+        now = timezone.now()
+        meals = Meal.objects.filter(
+            occurred_at__gte=now - timezone.timedelta(days=1),
+            occurred_at__lte=now,
+        ).order_by("-occurred_at")
+
+        plan = meals.explain()
+        assert "entries_mea_occurre_541c0a_idx" in plan
+        assert "TEMP B-TREE" not in plan
+
 
 @pytest.mark.django_db
 class TestCorrectionScale:
@@ -362,10 +400,16 @@ class TestCorrectionScale:
         assert time_diff < 1  # Should be within 1 second
         
         # Update and check that updated_at changes
-        import time
         time.sleep(0.01)  # Small delay to ensure updated_at is different
         scale.units_to_add = Decimal("2.5")
         scale.save()
         scale.refresh_from_db()
         
         assert scale.updated_at > scale.created_at
+
+    @pytest.mark.skipif(connection.vendor != "sqlite", reason="Checks SQLite query plan")
+    def test_ordering_uses_greater_than_index(self):
+        """Test that the threshold ordering is served by the greater_than index."""
+        plan = CorrectionScale.objects.all()[:50].explain()
+        assert "entries_cor_greater_85fb47_idx" in plan
+        assert "TEMP B-TREE" not in plan
@@ -0,0 +1,183 @@
+"""Tests for entries paginators."""
+import pytest
+from decimal import Decimal
+from django.db import connection
+from django.test import override_settings
+from django.test.utils import CaptureQueriesContext
+from django.utils import timezone
+
+from entries.models import GlucoseReading, Meal
+from entries.paginators import CachingPaginator
+
+
+def _create_reading(user):
+    return GlucoseReading.objects.create(
+        occurred_at=timezone.now(),
+        value=Decimal("5.5"),
+        unit="mmol/L",
+        last_modified_by=user
+    )
+
+
+def _file_cache(location):
+    return {
+        "default": {
+            "BACKEND": "django.core.cache.backends.filebased.FileBasedCache",
+            "LOCATION": str(location),
+        }
+    }
+
+
+@pytest.fixture
+def shared_cache(settings, tmp_path):
+    """Use a file-based cache, which is shared between processes."""
+    settings.CACHES = _file_cache(tmp_path)
+    return tmp_path
+
+
+@pytest.mark.django_db
+@pytest.mark.usefixtures("shared_cache")
+class TestCachingPaginator:
+    """Tests for CachingPaginator."""
+
+    def test_count_matches_queryset(self, user):
+        """Test that the count matches the number of objects."""
+        for _ in range(3):
+            _create_reading(user)
+
+        paginator = CachingPaginator(GlucoseReading.objects.all(), 10)
+        assert paginator.count == 3
+
+    def test_count_is_cached(self, user):
+        """Test that a second paginator reuses the cached count."""
+        _create_reading(user)
+        assert CachingPaginator(GlucoseReading.objects.all(), 10).count == 1
+
+        with CaptureQueriesContext(connection) as ctx:
+            count = CachingPaginator(GlucoseReading.objects.all(), 10).count
+
+        assert count == 1
+        assert len(ctx) == 0
+
+    def test_filters_are_cached_separately(self, user):
+        """Test that differently filtered querysets don't share a count."""
+        _create_reading(user)
+        GlucoseReading.objects.create(
+            occurred_at=timezone.now() - timezone.timedelta(days=3),
+            value=Decimal("6.0"),
+            unit="mmol/L",
+            last_modified_by=user
+        )
+        cutoff = timezone.now() - timezone.timedelta(days=1)
+
+        assert CachingPaginator(GlucoseReading.objects.all(), 10).count == 2
+        assert CachingPaginator(
+            GlucoseReading.objects.filter(occurred_at__gte=cutoff), 10
+        ).count == 1
+
+    def test_save_invalidates_count(self, user, django_capture_on_commit_callbacks):
+        """Test that creating an entry invalidates the cached count."""
+        _create_reading(user)
+        assert CachingPaginator(GlucoseReading.objects.all(), 10).count == 1
+
+        with django_capture_on_commit_callbacks(execute=True):
+            _create_reading(user)
+        assert CachingPaginator(GlucoseReading.objects.all(), 10).count == 2
+
+    def test_delete_invalidates_count(self, user, django_capture_on_commit_callbacks):
+        """Test that deleting an entry invalidates the cached count."""
+        reading = _create_reading(user)
+        _create_reading(user)
+        assert CachingPaginator(GlucoseReading.objects.all(), 10).count == 2
+
+        with django_capture_on_commit_callbacks(execute=True):
+            reading.delete()
+        assert CachingPaginator(GlucoseReading.objects.all(), 10).count == 1
+
+    def test_invalidation_is_per_model(self, user, django_capture_on_commit_callbacks):
+        """Test that saving a meal doesn't invalidate glucose reading counts."""
+        _create_reading(user)
+        assert CachingPaginator(GlucoseReading.objects.all(), 10).count == 1
+
+        with django_capture_on_commit_callbacks(execute=True):
+            Meal.objects.create(
+                occurred_at=timezone.now(),
+                meal_type="lunch",
+                description="Sandwich",
+                last_modified_by=user
+            )
+
+        with CaptureQueriesContext(connection) as ctx:
+            assert CachingPaginator(GlucoseReading.objects.all(), 10).count == 1
+        assert len(ctx) == 0
+
+    def test_write_in_another_worker_invalidates_count(
+        self, user, shared_cache, django_capture_on_commit_callbacks
+    ):
+        """Test that a write handled by another process isn't served a stale count."""
+        _create_reading(user)
+        assert CachingPaginator(GlucoseReading.objects.all(), 10).count == 1
+
+        # A fresh cache handler stands in for another gunicorn worker.
+        with override_settings(CACHES=_file_cache(shared_cache)):
+            with django_capture_on_commit_callbacks(execute=True):
+                _create_reading(user)
+
+        assert CachingPaginator(GlucoseReading.objects.all(), 10).count == 2
+
+    def test_invalidation_waits_for_commit(self, user, django_capture_on_commit_callbacks):
+        """Test that the count isn't invalidated before the write commits."""
+        _create_reading(user)
+        assert CachingPaginator(GlucoseReading.objects.all(), 10).count == 1
+
+        with django_capture_on_commit_callbacks() as callbacks:
+            _create_reading(user)
+
+        assert len(callbacks) == 1
+        assert CachingPaginator(GlucoseReading.objects.all(), 10).count == 1
+
+        callbacks[0]()
+        assert CachingPaginator(GlucoseReading.objects.all(), 10).count == 2
+
+    def test_empty_result_set_is_not_cached(self):
+        """Test that querysets that can't produce SQL fall back to counting."""
+        paginator = CachingPaginator(GlucoseReading.objects.filter(pk__in=[]), 10)
+        assert paginator.count == 0
+
+    def test_list_is_counted_directly(self):
+        """Test that plain lists are supported."""
+        assert CachingPaginator([1, 2, 3], 2).count == 3
+
+
+@pytest.mark.django_db
+class TestCachingPaginatorLocalCache:
+    """Tests for CachingPaginator with the per-process local-memory cache."""
+
+    def test_count_is_not_cached(self, user):
+        """Test that every paginator counts when the cache isn't shared."""
+        _create_reading(user)
+        assert CachingPaginator(GlucoseReading.objects.all(), 10).count == 1
+
+        with CaptureQueriesContext(connection) as ctx:
+            count = CachingPaginator(GlucoseReading.objects.all(), 10).count
+
+        assert count == 1
+        assert len(ctx) == 1
+
+    def test_write_without_local_invalidation_is_counted(self, user):
+        """Test that a write invalidated in another process's cache is counted."""
+        _create_reading(user)
+        assert CachingPaginator(GlucoseReading.objects.all(), 10).count == 1
+
+        # bulk_create sends no post_save, so nothing is invalidated here, just
+        # as when another worker handles the write.
+        GlucoseReading.objects.bulk_create([
+            GlucoseReading(
+                occurred_at=timezone.now(),
+                value=Decimal("6.0"),
+                unit="mmol/L",
+                last_modified_by=user
+            )
+        ])
+
+        assert CachingPaginator(GlucoseReading.objects.all(), 10).count == 2
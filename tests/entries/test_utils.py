@@ -75,6 +75,13 @@ class TestGetDateFilters:
         assert result["start_date"] == "2023-06-15"
         assert result["end_date"] == ""
 
+    def test_unpadded_date_is_accepted(self):
+        """Test that month and day don't need zero padding."""
+        request = self.factory.get("/", {"start_date": "2023-1-5"})
+        result = get_date_filters(request)
+        
+        assert result["start_datetime"].date() == datetime(2023, 1, 5).date()
+
     def test_end_date_only(self):
         """Test with only end date."""
         request = self.factory.get("/", {"end_date": "2023-12-31"})
@@ -1,10 +1,84 @@
 """Tests for entries views."""
+import uuid
 import pytest
-from django.urls import reverse
+from contextlib import contextmanager
+from datetime import time as dt_time
+from django.db import connection
+from django.test.utils import CaptureQueriesContext
+from django.urls import reverse, reverse_lazy
 from decimal import Decimal
 from django.utils import timezone
 
-from entries.models import CorrectionScale, GlucoseReading, Meal, InsulinDose, InsulinType
+from entries.models import (
+    CorrectionScale,
+    GlucoseReading,
+    InsulinDose,
+    InsulinSchedule,
+    InsulinType,
+    Meal,
+)
+from base.middleware import set_current_user
+
+D_0_0 = Decimal("0.0")
+D_1_0 = Decimal("1.0")
+D_2_0 = Decimal("2.0")
+D_5_0 = Decimal("5.0")
+D_5_5 = Decimal("5.5")
+D_6_0 = Decimal("6.0")
+D_8_0 = Decimal("8.0")
+D_10_0 = Decimal("10.0")
+D_10_5 = Decimal("10.5")
+D_12_0 = Decimal("12.0")
+D_30_0 = Decimal("30.0")
+D_45_5 = Decimal("45.5")
+
+NONEXISTENT_PK = uuid.UUID(int=1)
+
+GLUCOSE_LIST_URL = reverse_lazy("entries:glucose_readings_list")
+GLUCOSE_CREATE_URL = reverse_lazy("entries:glucose_reading_create")
+MEALS_LIST_URL = reverse_lazy("entries:meals_list")
+MEAL_CREATE_URL = reverse_lazy("entries:meal_create")
+ACTIVITY_URL = reverse_lazy("entries:activity")
+INSULIN_LIST_URL = reverse_lazy("entries:insulin_doses_list")
+INSULIN_CREATE_URL = reverse_lazy("entries:insulin_dose_create")
+SCHEDULES_LIST_URL = reverse_lazy("entries:insulin_schedules_list")
+SCHEDULE_CREATE_URL = reverse_lazy("entries:insulin_schedule_create")
+SCALES_LIST_URL = reverse_lazy("entries:correction_scales_list")
+SCALE_CREATE_URL = reverse_lazy("entries:correction_scale_create")
+
+
+@contextmanager
+def acting_as(user):
+    """Attribute model saves inside the block to user, as the middleware does."""
+    set_current_user(user)
+    try:
+        yield
+    finally:
+        set_current_user(None)
+
+
+def make_schedule(insulin_type, **overrides):
+    """Create an insulin schedule, filling in defaults for unspecified fields."""
+    fields = {"label": "Test", "time": dt_time(8, 0), "units": D_10_0, **overrides}
+    return InsulinSchedule.objects.create(insulin_type=insulin_type, **fields)
+
+
+def sole(queryset):
+    """Return the only object in a queryset, fetching at most two rows."""
+    rows = list(queryset[:2])
+    assert len(rows) == 1
+    return rows[0]
+
+
+def assert_redirects_to(response, url):
+    """Assert a redirect to url without fetching the target page."""
+    assert response.status_code == 302
+    assert response.url == url
+
+
+def rendered(response, template_name):
+    """Return whether the response rendered the named template."""
+    return any(t.name == template_name for t in response.templates)
 
 
 @pytest.mark.django_db
@@ -13,107 +87,105 @@ class TestGlucoseReadingsListView:
 
     def test_view_requires_authentication(self, client):
         """Test that the view requires authentication."""
-        response = client.get(reverse("entries:glucose_readings_list"))
+        response = client.get(GLUCOSE_LIST_URL)
         # Should redirect to login
         assert response.status_code == 302
         assert "/accounts/login/" in response.url
 
-    def test_view_with_authenticated_user(self, client, user):
+    def test_view_with_authenticated_user(self, auth_client):
         """Test that authenticated users can access the view."""
-        client.force_login(user)
-        response = client.get(reverse("entries:glucose_readings_list"))
+        response = auth_client.get(GLUCOSE_LIST_URL)
         assert response.status_code == 200
-        assert "entries/glucose_readings_list.html" in [t.name for t in response.templates]
+        assert rendered(response, "entries/glucose_readings_list.html")
 
-    def test_pagination_default_page_size(self, client, user):
+    def test_pagination_default_page_size(self, auth_client, user, django_assert_num_queries):
         """Test that default page size is 50."""
-        client.force_login(user)
-        
         # Create 75 readings
-        for i in range(75):
-            GlucoseReading.objects.create(
-                occurred_at=timezone.now() - timezone.timedelta(hours=i),
-                value=Decimal("5.5"),
-                unit="mmol/L",
-                last_modified_by=user
-            )
-        
-        response = client.get(reverse("entries:glucose_readings_list"))
+        now = timezone.now()
+        GlucoseReading.objects.bulk_create(
+            [
+                GlucoseReading(
+                    occurred_at=now - timezone.timedelta(hours=i),
+                    value=D_5_5,
+                    unit="mmol/L",
+                    last_modified_by=user
+                )
+                for i in range(75)
+            ],
+            batch_size=500,
+        )
+        
+        # User, count, chart data and page; no per-row deferred loads
+        with django_assert_num_queries(4):
+            response = auth_client.get(GLUCOSE_LIST_URL)
         assert response.status_code == 200
         assert len(response.context["page_obj"]) == 10
         assert response.context["page_size"] == 10
 
-    def test_pagination_custom_page_size(self, client, user):
+    @pytest.mark.parametrize("page_size,expected", [(10, 10), (25, 25), (50, 30), (100, 30)])
+    def test_pagination_custom_page_size(self, auth_client, user, page_size, expected):
         """Test custom page sizes."""
-        client.force_login(user)
-        
         # Create 30 readings
-        for i in range(30):
-            GlucoseReading.objects.create(
-                occurred_at=timezone.now() - timezone.timedelta(hours=i),
-                value=Decimal("5.5"),
-                unit="mmol/L",
-                last_modified_by=user
-            )
-        
-        for page_size in [10, 25, 50, 100]:
-            response = client.get(
-                reverse("entries:glucose_readings_list"),
-                {"page_size": page_size}
-            )
-            assert response.status_code == 200
-            expected_items = min(page_size, 30)
-            assert len(response.context["page_obj"]) == expected_items
-            assert response.context["page_size"] == page_size
+        now = timezone.now()
+        GlucoseReading.objects.bulk_create(
+            [
+                GlucoseReading(
+                    occurred_at=now - timezone.timedelta(hours=i),
+                    value=D_5_5,
+                    unit="mmol/L",
+                    last_modified_by=user
+                )
+                for i in range(30)
+            ],
+            batch_size=500,
+        )
+        
+        response = auth_client.get(GLUCOSE_LIST_URL, {"page_size": page_size})
+        assert response.status_code == 200
+        assert len(response.context["page_obj"]) == expected
+        assert response.context["page_size"] == page_size
 
-    def test_invalid_page_size_defaults_to_50(self, client, user):
+    def test_invalid_page_size_defaults_to_50(self, auth_client):
         """Test that invalid page size defaults to 50."""
-        client.force_login(user)
-        
         # Test with invalid page size
-        response = client.get(
-            reverse("entries:glucose_readings_list"),
+        response = auth_client.get(
+            GLUCOSE_LIST_URL,
             {"page_size": "invalid"}
         )
         assert response.status_code == 200
         assert response.context["page_size"] == 50
 
-    def test_readings_ordered_by_most_recent(self, client, user):
+    def test_readings_ordered_by_most_recent(self, auth_client, user):
         """Test that readings are ordered by most recent first."""
-        client.force_login(user)
-        
         # Create readings with specific times
         older_reading = GlucoseReading.objects.create(
             occurred_at=timezone.now() - timezone.timedelta(hours=2),
-            value=Decimal("5.0"),
+            value=D_5_0,
             unit="mmol/L",
             last_modified_by=user
         )
         newer_reading = GlucoseReading.objects.create(
             occurred_at=timezone.now() - timezone.timedelta(hours=1),
-            value=Decimal("6.0"),
+            value=D_6_0,
             unit="mmol/L",
             last_modified_by=user
         )
         
-        response = client.get(reverse("entries:glucose_readings_list"))
+        response = auth_client.get(GLUCOSE_LIST_URL)
         readings = list(response.context["page_obj"])
         
         # Newer reading should be first
         assert readings[0].id == newer_reading.id
         assert readings[1].id == older_reading.id
 
-    def test_empty_readings_list(self, client, user):
+    def test_empty_readings_list(self, auth_client):
         """Test view with no readings."""
-        client.force_login(user)
-        response = client.get(reverse("entries:glucose_readings_list"))
+        response = auth_client.get(GLUCOSE_LIST_URL)
         assert response.status_code == 200
         assert len(response.context["page_obj"]) == 0
 
-    def test_filter_today(self, client, user):
+    def test_filter_today(self, auth_client, user):
         """Test filtering readings for today."""
-        client.force_login(user)
-        
         # Create readings for today and yesterday
         today = timezone.now()
         yesterday = today - timezone.timedelta(days=1)
@@ -121,19 +193,19 @@ class TestGlucoseReadingsListView:
         
         today_reading = GlucoseReading.objects.create(
             occurred_at=today,
-            value=Decimal("5.5"),
+            value=D_5_5,
             unit="mmol/L",
             last_modified_by=user
         )
         yesterday_reading = GlucoseReading.objects.create(
             occurred_at=yesterday,
-            value=Decimal("6.0"),
+            value=D_6_0,
             unit="mmol/L",
             last_modified_by=user
         )
         
-        response = client.get(
-            reverse("entries:glucose_readings_list"),
+        response = auth_client.get(
+            GLUCOSE_LIST_URL,
             {"start_date": today_str, "end_date": today_str}
         )
         
@@ -142,10 +214,8 @@ class TestGlucoseReadingsListView:
         assert len(readings) == 1
         assert readings[0].id == today_reading.id
 
-    def test_filter_two_days(self, client, user):
+    def test_filter_two_days(self, auth_client, user):
         """Test filtering readings for yesterday and today (2 days)."""
-        client.force_login(user)
-        
         # Create readings for today, yesterday, and 2 days ago
         today = timezone.now()
         yesterday = today - timezone.timedelta(days=1)
@@ -156,13 +226,13 @@ class TestGlucoseReadingsListView:
         
         today_reading = GlucoseReading.objects.create(
             occurred_at=today,
-            value=Decimal("5.5"),
+            value=D_5_5,
             unit="mmol/L",
             last_modified_by=user
         )
         yesterday_reading = GlucoseReading.objects.create(
             occurred_at=yesterday,
-            value=Decimal("6.0"),
+            value=D_6_0,
             unit="mmol/L",
             last_modified_by=user
         )
@@ -173,8 +243,8 @@ class TestGlucoseReadingsListView:
             last_modified_by=user
         )
         
-        response = client.get(
-            reverse("entries:glucose_readings_list"),
+        response = auth_client.get(
+            GLUCOSE_LIST_URL,
             {"start_date": yesterday_str, "end_date": today_str}
         )
         
@@ -183,37 +253,16 @@ class TestGlucoseReadingsListView:
         assert len(readings) == 2
         assert {r.id for r in readings} == {today_reading.id, yesterday_reading.id}
 
-    def test_filter_custom_date_range(self, client, user):
+    def test_filter_custom_date_range(self, auth_client, three_day_readings):
         """Test filtering readings with custom date range."""
-        client.force_login(user)
-        
-        # Create readings across multiple days
-        now = timezone.now()
-        reading_day1 = GlucoseReading.objects.create(
-            occurred_at=now - timezone.timedelta(days=5),
-            value=Decimal("5.0"),
-            unit="mmol/L",
-            last_modified_by=user
-        )
-        reading_day2 = GlucoseReading.objects.create(
-            occurred_at=now - timezone.timedelta(days=3),
-            value=Decimal("5.5"),
-            unit="mmol/L",
-            last_modified_by=user
-        )
-        reading_day3 = GlucoseReading.objects.create(
-            occurred_at=now - timezone.timedelta(days=1),
-            value=Decimal("6.0"),
-            unit="mmol/L",
-            last_modified_by=user
-        )
+        reading_day1, reading_day2, reading_day3 = three_day_readings
         
         # Filter for middle day only
-        start_date = (now - timezone.timedelta(days=4)).strftime("%Y-%m-%d")
-        end_date = (now - timezone.timedelta(days=2)).strftime("%Y-%m-%d")
+        start_date = (reading_day2.occurred_at - timezone.timedelta(days=1)).strftime("%Y-%m-%d")
+        end_date = (reading_day2.occurred_at + timezone.timedelta(days=1)).strftime("%Y-%m-%d")
         
-        response = client.get(
-            reverse("entries:glucose_readings_list"),
+        response = auth_client.get(
+            GLUCOSE_LIST_URL,
             {"start_date": start_date, "end_date": end_date}
         )
         
@@ -224,34 +273,32 @@ class TestGlucoseReadingsListView:
         assert response.context["start_date"] == start_date
         assert response.context["end_date"] == end_date
 
-    def test_filter_start_date_only(self, client, user):
+    def test_date_filter_compares_occurred_at_directly(self, auth_client):
+        """Test that date filters don't wrap occurred_at in a date cast."""
+        today_str = timezone.now().date().strftime("%Y-%m-%d")
+
+        with CaptureQueriesContext(connection) as ctx:
+            auth_client.get(
+                GLUCOSE_LIST_URL,
+                {"start_date": today_str, "end_date": today_str}
+            )
+
+        reading_queries = [
+            q["sql"] for q in ctx.captured_queries
+            if "entries_glucosereading" in q["sql"]
+        ]
+        assert reading_queries
+        for sql in reading_queries:
+            assert "cast_date" not in sql.lower()
+            assert '"entries_glucosereading"."occurred_at" >=' in sql
+
+    def test_filter_start_date_only(self, auth_client, three_day_readings):
         """Test filtering with only start date."""
-        client.force_login(user)
-        
-        now = timezone.now()
-        old_reading = GlucoseReading.objects.create(
-            occurred_at=now - timezone.timedelta(days=5),
-            value=Decimal("5.0"),
-            unit="mmol/L",
-            last_modified_by=user
-        )
-        recent_reading1 = GlucoseReading.objects.create(
-            occurred_at=now - timezone.timedelta(days=2),
-            value=Decimal("5.5"),
-            unit="mmol/L",
-            last_modified_by=user
-        )
-        recent_reading2 = GlucoseReading.objects.create(
-            occurred_at=now,
-            value=Decimal("6.0"),
-            unit="mmol/L",
-            last_modified_by=user
-        )
-        
-        start_date = (now - timezone.timedelta(days=3)).strftime("%Y-%m-%d")
+        old_reading, recent_reading1, recent_reading2 = three_day_readings
+        start_date = recent_reading1.occurred_at.strftime("%Y-%m-%d")
         
-        response = client.get(
-            reverse("entries:glucose_readings_list"),
+        response = auth_client.get(
+            GLUCOSE_LIST_URL,
             {"start_date": start_date}
         )
         
@@ -263,34 +310,13 @@ class TestGlucoseReadingsListView:
         assert recent_reading2.id in reading_ids
         assert old_reading.id not in reading_ids
 
-    def test_filter_end_date_only(self, client, user):
+    def test_filter_end_date_only(self, auth_client, three_day_readings):
         """Test filtering with only end date."""
-        client.force_login(user)
-        
-        now = timezone.now()
-        old_reading1 = GlucoseReading.objects.create(
-            occurred_at=now - timezone.timedelta(days=5),
-            value=Decimal("5.0"),
-            unit="mmol/L",
-            last_modified_by=user
-        )
-        old_reading2 = GlucoseReading.objects.create(
-            occurred_at=now - timezone.timedelta(days=3),
-            value=Decimal("5.5"),
-            unit="mmol/L",
-            last_modified_by=user
-        )
-        recent_reading = GlucoseReading.objects.create(
-            occurred_at=now,
-            value=Decimal("6.0"),
-            unit="mmol/L",
-            last_modified_by=user
-        )
-        
-        end_date = (now - timezone.timedelta(days=2)).strftime("%Y-%m-%d")
+        old_reading1, old_reading2, recent_reading = three_day_readings
+        end_date = (old_reading2.occurred_at + timezone.timedelta(days=1)).strftime("%Y-%m-%d")
         
-        response = client.get(
-            reverse("entries:glucose_readings_list"),
+        response = auth_client.get(
+            GLUCOSE_LIST_URL,
             {"end_date": end_date}
         )
         
@@ -302,36 +328,44 @@ class TestGlucoseReadingsListView:
         assert old_reading2.id in reading_ids
         assert recent_reading.id not in reading_ids
 
-    def test_filter_preserves_pagination(self, client, user):
+    def test_filter_preserves_pagination(self, auth_client, user):
         """Test that filtering works correctly with pagination."""
-        client.force_login(user)
-        
         # Create 30 readings for today (using different minutes to stay within today)
         today = timezone.now()
         today_start = today.replace(hour=8, minute=0, second=0, microsecond=0)
-        for i in range(30):
-            GlucoseReading.objects.create(
-                occurred_at=today_start + timezone.timedelta(minutes=i * 10),
-                value=Decimal("5.5"),
-                unit="mmol/L",
-                last_modified_by=user
-            )
+        GlucoseReading.objects.bulk_create(
+            [
+                GlucoseReading(
+                    occurred_at=today_start + timezone.timedelta(minutes=i * 10),
+                    value=D_5_5,
+                    unit="mmol/L",
+                    last_modified_by=user
+                )
+                for i in range(30)
+            ],
+            batch_size=500,
+        )
         
         # Create 20 readings for yesterday
         yesterday = today - timezone.timedelta(days=1)
         yesterday_start = yesterday.replace(hour=8, minute=0, second=0, microsecond=0)
-        for i in range(20):
-            GlucoseReading.objects.create(
-                occurred_at=yesterday_start + timezone.timedelta(minutes=i * 10),
-                value=Decimal("6.0"),
-                unit="mmol/L",
-                last_modified_by=user
-            )
+        GlucoseReading.objects.bulk_create(
+            [
+                GlucoseReading(
+                    occurred_at=yesterday_start + timezone.timedelta(minutes=i * 10),
+                    value=D_6_0,
+                    unit="mmol/L",
+                    last_modified_by=user
+                )
+                for i in range(20)
+            ],
+            batch_size=500,
+        )
         
         # Filter for today with page size of 10
         today_str = today.date().strftime("%Y-%m-%d")
-        response = client.get(
-            reverse("entries:glucose_readings_list"),
+        response = auth_client.get(
+            GLUCOSE_LIST_URL,
             {"start_date": today_str, "end_date": today_str, "page_size": "10"}
         )
         
@@ -340,20 +374,23 @@ class TestGlucoseReadingsListView:
         assert response.context["page_obj"].paginator.count == 30
         assert response.context["page_size"] == 10
 
-    def test_no_filter_returns_all_readings(self, client, user):
+    def test_no_filter_returns_all_readings(self, auth_client, user):
         """Test that no filter returns all readings."""
-        client.force_login(user)
-        
         now = timezone.now()
-        for i in range(5):
-            GlucoseReading.objects.create(
-                occurred_at=now - timezone.timedelta(days=i),
-                value=Decimal("5.5"),
-                unit="mmol/L",
-                last_modified_by=user
-            )
+        GlucoseReading.objects.bulk_create(
+            [
+                GlucoseReading(
+                    occurred_at=now - timezone.timedelta(days=i),
+                    value=D_5_5,
+                    unit="mmol/L",
+                    last_modified_by=user
+                )
+                for i in range(5)
+            ],
+            batch_size=500,
+        )
         
-        response = client.get(reverse("entries:glucose_readings_list"))
+        response = auth_client.get(GLUCOSE_LIST_URL)
         
         assert response.status_code == 200
         assert len(response.context["page_obj"]) == 5
@@ -367,56 +404,49 @@ class TestGlucoseReadingCreateView:
 
     def test_view_requires_authentication(self, client):
         """Test that the view requires authentication."""
-        response = client.get(reverse("entries:glucose_reading_create"))
+        response = client.get(GLUCOSE_CREATE_URL)
         # Should redirect to login
         assert response.status_code == 302
         assert "/accounts/login/" in response.url
 
-    def test_get_form_display(self, client, user):
+    def test_get_form_display(self, auth_client):
         """Test that authenticated users can access the form."""
-        client.force_login(user)
-        response = client.get(reverse("entries:glucose_reading_create"))
+        response = auth_client.get(GLUCOSE_CREATE_URL)
         assert response.status_code == 200
         assert "form" in response.context
         assert response.context["title"] == "Add Blood Glucose Reading"
-        assert "entries/glucose_reading_form.html" in [t.name for t in response.templates]
+        assert rendered(response, "entries/glucose_reading_form.html")
 
-    def test_create_reading_success(self, client, user):
+    def test_create_reading_success(self, auth_client, user, now_str):
         """Test successful reading creation."""
-        client.force_login(user)
-        
         data = {
-            "occurred_at": timezone.now().strftime("%Y-%m-%dT%H:%M"),
+            "occurred_at": now_str,
             "value": "5.5",
             "unit": "mmol/L",
             "notes": "Before breakfast",
         }
         
-        response = client.post(reverse("entries:glucose_reading_create"), data)
+        response = auth_client.post(GLUCOSE_CREATE_URL, data)
         
         # Should redirect to readings list
-        assert response.status_code == 302
-        assert response.url == reverse("entries:glucose_readings_list")
+        assert_redirects_to(response, GLUCOSE_LIST_URL)
         
         # Reading should be created
-        assert GlucoseReading.objects.count() == 1
-        reading = GlucoseReading.objects.first()
-        assert reading.value == Decimal("5.5")
+        reading = sole(GlucoseReading.objects.all())
+        assert reading.value == D_5_5
         assert reading.unit == "mmol/L"
         assert reading.notes == "Before breakfast"
         assert reading.last_modified_by == user
 
-    def test_create_reading_invalid_value(self, client, user):
+    def test_create_reading_invalid_value(self, auth_client, now_str):
         """Test that invalid form submission shows errors."""
-        client.force_login(user)
-        
         data = {
-            "occurred_at": timezone.now().strftime("%Y-%m-%dT%H:%M"),
+            "occurred_at": now_str,
             "value": "invalid",
             "unit": "mmol/L",
         }
         
-        response = client.post(reverse("entries:glucose_reading_create"), data)
+        response = auth_client.post(GLUCOSE_CREATE_URL, data)
         
         # Should not redirect, show form with errors
         assert response.status_code == 200
@@ -424,34 +454,29 @@ class TestGlucoseReadingCreateView:
         assert not response.context["form"].is_valid()
         assert GlucoseReading.objects.count() == 0
 
-    def test_create_reading_without_notes(self, client, user):
+    def test_create_reading_without_notes(self, auth_client, now_str):
         """Test that notes field is optional."""
-        client.force_login(user)
-        
         data = {
-            "occurred_at": timezone.now().strftime("%Y-%m-%dT%H:%M"),
+            "occurred_at": now_str,
             "value": "6.2",
             "unit": "mg/dL",
         }
         
-        response = client.post(reverse("entries:glucose_reading_create"), data)
+        response = auth_client.post(GLUCOSE_CREATE_URL, data)
         
         assert response.status_code == 302
-        assert GlucoseReading.objects.count() == 1
-        reading = GlucoseReading.objects.first()
+        reading = sole(GlucoseReading.objects.all())
         assert reading.notes == ""
 
-    def test_create_reading_missing_required_fields(self, client, user):
+    def test_create_reading_missing_required_fields(self, auth_client):
         """Test that required fields are enforced."""
-        client.force_login(user)
-        
         # Missing occurred_at
         data = {
             "value": "5.5",
             "unit": "mmol/L",
         }
         
-        response = client.post(reverse("entries:glucose_reading_create"), data)
+        response = auth_client.post(GLUCOSE_CREATE_URL, data)
         assert response.status_code == 200
         assert not response.context["form"].is_valid()
         assert GlucoseReading.objects.count() == 0
@@ -465,7 +490,7 @@ class TestGlucoseReadingEditView:
         """Test that the view requires authentication."""
         reading = GlucoseReading.objects.create(
             occurred_at=timezone.now(),
-            value=Decimal("5.5"),
+            value=D_5_5,
             unit="mmol/L",
             last_modified_by=user,
         )
@@ -475,35 +500,32 @@ class TestGlucoseReadingEditView:
         assert response.status_code == 302
         assert "/accounts/login/" in response.url
 
-    def test_get_edit_form_display(self, client, user):
+    def test_get_edit_form_display(self, auth_client, user):
         """Test that authenticated users can access the edit form."""
         reading = GlucoseReading.objects.create(
             occurred_at=timezone.now(),
-            value=Decimal("5.5"),
+            value=D_5_5,
             unit="mmol/L",
             last_modified_by=user,
         )
         
-        client.force_login(user)
-        response = client.get(reverse("entries:glucose_reading_edit", args=[reading.pk]))
+        response = auth_client.get(reverse("entries:glucose_reading_edit", args=[reading.pk]))
         assert response.status_code == 200
         assert "form" in response.context
         assert response.context["title"] == "Edit Blood Glucose Reading"
         assert response.context["reading"] == reading
-        assert "entries/glucose_reading_form.html" in [t.name for t in response.templates]
+        assert rendered(response, "entries/glucose_reading_form.html")
 
-    def test_edit_reading_success(self, client, user):
+    def test_edit_reading_success(self, auth_client, user):
         """Test successful reading update."""
         reading = GlucoseReading.objects.create(
             occurred_at=timezone.now(),
-            value=Decimal("5.5"),
+            value=D_5_5,
             unit="mmol/L",
             notes="Original note",
             last_modified_by=user,
         )
         
-        client.force_login(user)
-        
         new_time = timezone.now() + timezone.timedelta(hours=1)
         data = {
             "occurred_at": new_time.strftime("%Y-%m-%dT%H:%M"),
@@ -512,11 +534,10 @@ class TestGlucoseReadingEditView:
             "notes": "Updated note",
         }
         
-        response = client.post(reverse("entries:glucose_reading_edit", args=[reading.pk]), data)
+        response = auth_client.post(reverse("entries:glucose_reading_edit", args=[reading.pk]), data)
         
         # Should redirect to readings list
-        assert response.status_code == 302
-        assert response.url == reverse("entries:glucose_readings_list")
+        assert_redirects_to(response, GLUCOSE_LIST_URL)
         
         # Reading should be updated
         reading.refresh_from_db()
@@ -525,52 +546,43 @@ class TestGlucoseReadingEditView:
         assert reading.notes == "Updated note"
         assert reading.last_modified_by == user
 
-    def test_cannot_edit_other_users_reading(self, client, user, second_user):
+    def test_cannot_edit_other_users_reading(self, auth_client, second_user):
         """Test that users cannot edit readings created by other users."""
         reading = GlucoseReading.objects.create(
             occurred_at=timezone.now(),
-            value=Decimal("5.5"),
+            value=D_5_5,
             unit="mmol/L",
             last_modified_by=second_user,
         )
         
-        client.force_login(user)
-        response = client.get(reverse("entries:glucose_reading_edit", args=[reading.pk]))
+        response = auth_client.get(reverse("entries:glucose_reading_edit", args=[reading.pk]))
         
         # Should redirect to readings list with error
-        assert response.status_code == 302
-        assert response.url == reverse("entries:glucose_readings_list")
+        assert_redirects_to(response, GLUCOSE_LIST_URL)
 
-    def test_edit_nonexistent_reading(self, client, user):
+    def test_edit_nonexistent_reading(self, auth_client):
         """Test editing a reading that doesn't exist."""
-        import uuid
-        fake_uuid = uuid.uuid4()
-        
-        client.force_login(user)
-        response = client.get(reverse("entries:glucose_reading_edit", args=[fake_uuid]))
+        response = auth_client.get(reverse("entries:glucose_reading_edit", args=[NONEXISTENT_PK]))
         
         # Should redirect to readings list with error
-        assert response.status_code == 302
-        assert response.url == reverse("entries:glucose_readings_list")
+        assert_redirects_to(response, GLUCOSE_LIST_URL)
 
-    def test_edit_reading_invalid_value(self, client, user):
+    def test_edit_reading_invalid_value(self, auth_client, user, now_str):
         """Test that invalid form submission shows errors."""
         reading = GlucoseReading.objects.create(
             occurred_at=timezone.now(),
-            value=Decimal("5.5"),
+            value=D_5_5,
             unit="mmol/L",
             last_modified_by=user,
         )
         
-        client.force_login(user)
-        
         data = {
-            "occurred_at": timezone.now().strftime("%Y-%m-%dT%H:%M"),
+            "occurred_at": now_str,
             "value": "not_a_number",
             "unit": "mmol/L",
         }
         
-        response = client.post(reverse("entries:glucose_reading_edit", args=[reading.pk]), data)
+        response = auth_client.post(reverse("entries:glucose_reading_edit", args=[reading.pk]), data)
         
         # Should not redirect, show form with errors
         assert response.status_code == 200
@@ -579,28 +591,26 @@ class TestGlucoseReadingEditView:
         
         # Original value should be unchanged
         reading.refresh_from_db()
-        assert reading.value == Decimal("5.5")
+        assert reading.value == D_5_5
 
-    def test_edit_preserves_timestamps(self, client, user):
+    def test_edit_preserves_timestamps(self, auth_client, user, now_str):
         """Test that editing preserves created_at timestamp."""
         original_time = timezone.now() - timezone.timedelta(days=1)
         reading = GlucoseReading.objects.create(
             occurred_at=original_time,
-            value=Decimal("5.5"),
+            value=D_5_5,
             unit="mmol/L",
             last_modified_by=user,
         )
         original_created_at = reading.created_at
         
-        client.force_login(user)
-        
         data = {
-            "occurred_at": timezone.now().strftime("%Y-%m-%dT%H:%M"),
+            "occurred_at": now_str,
             "value": "6.0",
             "unit": "mmol/L",
         }
         
-        response = client.post(reverse("entries:glucose_reading_edit", args=[reading.pk]), data)
+        response = auth_client.post(reverse("entries:glucose_reading_edit", args=[reading.pk]), data)
         
         assert response.status_code == 302
         
@@ -617,75 +627,76 @@ class TestMealsListView:
 
     def test_view_requires_authentication(self, client):
         """Test that the view requires authentication."""
-        response = client.get(reverse("entries:meals_list"))
+        response = client.get(MEALS_LIST_URL)
         # Should redirect to login
         assert response.status_code == 302
         assert "/accounts/login/" in response.url
 
-    def test_view_with_authenticated_user(self, client, user):
+    def test_view_with_authenticated_user(self, auth_client):
         """Test that authenticated users can access the view."""
-        client.force_login(user)
-        response = client.get(reverse("entries:meals_list"))
+        response = auth_client.get(MEALS_LIST_URL)
         assert response.status_code == 200
-        assert "entries/meals_list.html" in [t.name for t in response.templates]
+        assert rendered(response, "entries/meals_list.html")
 
-    def test_pagination_default_page_size(self, client, user):
+    def test_pagination_default_page_size(self, auth_client, user, django_assert_num_queries):
         """Test that default page size is 50."""
-        client.force_login(user)
-        
         # Create 75 meals
-        for i in range(75):
-            Meal.objects.create(
-                occurred_at=timezone.now() - timezone.timedelta(hours=i),
-                meal_type="breakfast",
-                description=f"Test meal {i}",
-                last_modified_by=user
-            )
-        
-        response = client.get(reverse("entries:meals_list"))
+        now = timezone.now()
+        Meal.objects.bulk_create(
+            [
+                Meal(
+                    occurred_at=now - timezone.timedelta(hours=i),
+                    meal_type="breakfast",
+                    description=f"Test meal {i}",
+                    last_modified_by=user
+                )
+                for i in range(75)
+            ],
+            batch_size=500,
+        )
+        
+        # User, count and page; no per-row deferred loads
+        with django_assert_num_queries(3):
+            response = auth_client.get(MEALS_LIST_URL)
         assert response.status_code == 200
         assert len(response.context["page_obj"]) == 50
         assert response.context["page_size"] == 50
 
-    def test_pagination_custom_page_size(self, client, user):
+    @pytest.mark.parametrize("page_size,expected", [(10, 10), (25, 25), (50, 30), (100, 30)])
+    def test_pagination_custom_page_size(self, auth_client, user, page_size, expected):
         """Test custom page sizes."""
-        client.force_login(user)
-        
         # Create 30 meals
-        for i in range(30):
-            Meal.objects.create(
-                occurred_at=timezone.now() - timezone.timedelta(hours=i),
-                meal_type="lunch",
-                description=f"Test meal {i}",
-                last_modified_by=user
-            )
-        
-        for page_size in [10, 25, 50, 100]:
-            response = client.get(
-                reverse("entries:meals_list"),
-                {"page_size": page_size}
-            )
-            assert response.status_code == 200
-            expected_items = min(page_size, 30)
-            assert len(response.context["page_obj"]) == expected_items
-            assert response.context["page_size"] == page_size
+        now = timezone.now()
+        Meal.objects.bulk_create(
+            [
+                Meal(
+                    occurred_at=now - timezone.timedelta(hours=i),
+                    meal_type="lunch",
+                    description=f"Test meal {i}",
+                    last_modified_by=user
+                )
+                for i in range(30)
+            ],
+            batch_size=500,
+        )
+        
+        response = auth_client.get(MEALS_LIST_URL, {"page_size": page_size})
+        assert response.status_code == 200
+        assert len(response.context["page_obj"]) == expected
+        assert response.context["page_size"] == page_size
 
-    def test_invalid_page_size_defaults_to_50(self, client, user):
+    def test_invalid_page_size_defaults_to_50(self, auth_client):
         """Test that invalid page size defaults to 50."""
-        client.force_login(user)
-        
         # Test with invalid page size
-        response = client.get(
-            reverse("entries:meals_list"),
+        response = auth_client.get(
+            MEALS_LIST_URL,
             {"page_size": "invalid"}
         )
         assert response.status_code == 200
         assert response.context["page_size"] == 50
 
-    def test_meals_ordered_by_most_recent(self, client, user):
+    def test_meals_ordered_by_most_recent(self, auth_client, user):
         """Test that meals are ordered by most recent first."""
-        client.force_login(user)
-        
         # Create meals with specific times
         older_meal = Meal.objects.create(
             occurred_at=timezone.now() - timezone.timedelta(hours=2),
@@ -700,42 +711,37 @@ class TestMealsListView:
             last_modified_by=user
         )
         
-        response = client.get(reverse("entries:meals_list"))
+        response = auth_client.get(MEALS_LIST_URL)
         meals = list(response.context["page_obj"])
         
         # Newer meal should be first
         assert meals[0].id == newer_meal.id
         assert meals[1].id == older_meal.id
 
-    def test_empty_meals_list(self, client, user):
+    def test_empty_meals_list(self, auth_client):
         """Test view with no meals."""
-        client.force_login(user)
-        response = client.get(reverse("entries:meals_list"))
+        response = auth_client.get(MEALS_LIST_URL)
         assert response.status_code == 200
         assert len(response.context["page_obj"]) == 0
 
-    def test_meals_display_with_carbs(self, client, user):
+    def test_meals_display_with_carbs(self, auth_client, user):
         """Test meals display with carbs information."""
-        client.force_login(user)
-        
         meal_with_carbs = Meal.objects.create(
             occurred_at=timezone.now(),
             meal_type="lunch",
             description="Pasta with sauce",
-            total_carbs=Decimal("45.5"),
+            total_carbs=D_45_5,
             last_modified_by=user
         )
         
-        response = client.get(reverse("entries:meals_list"))
+        response = auth_client.get(MEALS_LIST_URL)
         assert response.status_code == 200
         meals = list(response.context["page_obj"])
         assert len(meals) == 1
-        assert meals[0].total_carbs == Decimal("45.5")
+        assert meals[0].total_carbs == D_45_5
 
-    def test_meals_display_without_carbs(self, client, user):
+    def test_meals_display_without_carbs(self, auth_client, user):
         """Test meals display without carbs information."""
-        client.force_login(user)
-        
         meal_without_carbs = Meal.objects.create(
             occurred_at=timezone.now(),
             meal_type="snack",
@@ -743,7 +749,7 @@ class TestMealsListView:
             last_modified_by=user
         )
         
-        response = client.get(reverse("entries:meals_list"))
+        response = auth_client.get(MEALS_LIST_URL)
         assert response.status_code == 200
         meals = list(response.context["page_obj"])
         assert len(meals) == 1
@@ -756,125 +762,108 @@ class TestMealCreateView:
 
     def test_view_requires_authentication(self, client):
         """Test that the view requires authentication."""
-        response = client.get(reverse("entries:meal_create"))
+        response = client.get(MEAL_CREATE_URL)
         # Should redirect to login
         assert response.status_code == 302
         assert "/accounts/login/" in response.url
 
-    def test_get_form_display(self, client, user):
+    def test_get_form_display(self, auth_client):
         """Test that authenticated users can access the form."""
-        client.force_login(user)
-        response = client.get(reverse("entries:meal_create"))
+        response = auth_client.get(MEAL_CREATE_URL)
         assert response.status_code == 200
         assert "form" in response.context
         assert response.context["title"] == "Add Meal"
-        assert "entries/meal_form.html" in [t.name for t in response.templates]
+        assert rendered(response, "entries/meal_form.html")
 
-    def test_create_meal_success(self, client, user):
+    def test_create_meal_success(self, auth_client, user, now_str):
         """Test successful meal creation."""
-        client.force_login(user)
-        
         data = {
-            "occurred_at": timezone.now().strftime("%Y-%m-%dT%H:%M"),
+            "occurred_at": now_str,
             "meal_type": "breakfast",
             "description": "Oatmeal with berries and honey",
             "total_carbs": "45.5",
             "notes": "Felt good after",
         }
         
-        response = client.post(reverse("entries:meal_create"), data)
+        response = auth_client.post(MEAL_CREATE_URL, data)
         
         # Should redirect to meals list
-        assert response.status_code == 302
-        assert response.url == reverse("entries:meals_list")
+        assert_redirects_to(response, MEALS_LIST_URL)
         
         # Meal should be created
-        assert Meal.objects.count() == 1
-        meal = Meal.objects.first()
+        meal = sole(Meal.objects.all())
         assert meal.meal_type == "breakfast"
         assert meal.description == "Oatmeal with berries and honey"
-        assert meal.total_carbs == Decimal("45.5")
+        assert meal.total_carbs == D_45_5
         assert meal.notes == "Felt good after"
         assert meal.last_modified_by == user
 
-    def test_create_meal_without_carbs(self, client, user):
+    def test_create_meal_without_carbs(self, auth_client, now_str):
         """Test that carbs field is optional."""
-        client.force_login(user)
-        
         data = {
-            "occurred_at": timezone.now().strftime("%Y-%m-%dT%H:%M"),
+            "occurred_at": now_str,
             "meal_type": "snack",
             "description": "Sugar-free jello",
         }
         
-        response = client.post(reverse("entries:meal_create"), data)
+        response = auth_client.post(MEAL_CREATE_URL, data)
         
         assert response.status_code == 302
-        assert Meal.objects.count() == 1
-        meal = Meal.objects.first()
+        meal = sole(Meal.objects.all())
         assert meal.total_carbs is None
         assert meal.notes == ""
 
-    def test_create_meal_without_notes(self, client, user):
+    def test_create_meal_without_notes(self, auth_client, now_str):
         """Test that notes field is optional."""
-        client.force_login(user)
-        
         data = {
-            "occurred_at": timezone.now().strftime("%Y-%m-%dT%H:%M"),
+            "occurred_at": now_str,
             "meal_type": "lunch",
             "description": "Grilled chicken salad",
             "total_carbs": "12.0",
         }
         
-        response = client.post(reverse("entries:meal_create"), data)
+        response = auth_client.post(MEAL_CREATE_URL, data)
         
         assert response.status_code == 302
-        assert Meal.objects.count() == 1
-        meal = Meal.objects.first()
+        meal = sole(Meal.objects.all())
         assert meal.notes == ""
 
-    def test_create_meal_missing_required_fields(self, client, user):
+    def test_create_meal_missing_required_fields(self, auth_client, now_str):
         """Test that required fields are enforced."""
-        client.force_login(user)
-        
         # Missing description
         data = {
-            "occurred_at": timezone.now().strftime("%Y-%m-%dT%H:%M"),
+            "occurred_at": now_str,
             "meal_type": "dinner",
         }
         
-        response = client.post(reverse("entries:meal_create"), data)
+        response = auth_client.post(MEAL_CREATE_URL, data)
         assert response.status_code == 200
         assert not response.context["form"].is_valid()
         assert Meal.objects.count() == 0
 
-    def test_create_meal_invalid_meal_type(self, client, user):
+    def test_create_meal_invalid_meal_type(self, auth_client, now_str):
         """Test that invalid meal type is rejected."""
-        client.force_login(user)
-        
         data = {
-            "occurred_at": timezone.now().strftime("%Y-%m-%dT%H:%M"),
+            "occurred_at": now_str,
             "meal_type": "invalid_type",
             "description": "Test meal",
         }
         
-        response = client.post(reverse("entries:meal_create"), data)
+        response = auth_client.post(MEAL_CREATE_URL, data)
         assert response.status_code == 200
         assert not response.context["form"].is_valid()
         assert Meal.objects.count() == 0
 
-    def test_create_meal_invalid_carbs(self, client, user):
+    def test_create_meal_invalid_carbs(self, auth_client, now_str):
         """Test that invalid carbs value shows errors."""
-        client.force_login(user)
-        
         data = {
-            "occurred_at": timezone.now().strftime("%Y-%m-%dT%H:%M"),
+            "occurred_at": now_str,
             "meal_type": "breakfast",
             "description": "Test meal",
             "total_carbs": "not_a_number",
         }
         
-        response = client.post(reverse("entries:meal_create"), data)
+        response = auth_client.post(MEAL_CREATE_URL, data)
         
         # Should not redirect, show form with errors
         assert response.status_code == 200
@@ -882,25 +871,18 @@ class TestMealCreateView:
         assert not response.context["form"].is_valid()
         assert Meal.objects.count() == 0
 
-    def test_create_meal_all_meal_types(self, client, user):
-        """Test creating meals with all valid meal types."""
-        client.force_login(user)
-        
-        meal_types = ["breakfast", "lunch", "dinner", "snack"]
-        
-        for meal_type in meal_types:
-            data = {
-                "occurred_at": timezone.now().strftime("%Y-%m-%dT%H:%M"),
-                "meal_type": meal_type,
-                "description": f"Test {meal_type}",
-            }
-            
-            response = client.post(reverse("entries:meal_create"), data)
-            assert response.status_code == 302
+    @pytest.mark.parametrize("meal_type", ["breakfast", "lunch", "dinner", "snack"])
+    def test_create_meal_all_meal_types(self, auth_client, meal_type, now_str):
+        """Test creating meals with each valid meal type."""
+        data = {
+            "occurred_at": now_str,
+            "meal_type": meal_type,
+            "description": f"Test {meal_type}",
+        }
         
-        assert Meal.objects.count() == len(meal_types)
-        created_types = set(Meal.objects.values_list("meal_type", flat=True))
-        assert created_types == set(meal_types)
+        response = auth_client.post(MEAL_CREATE_URL, data)
+        assert response.status_code == 302
+        assert sole(Meal.objects.all()).meal_type == meal_type
 
 
 @pytest.mark.django_db
@@ -921,7 +903,7 @@ class TestMealEditView:
         assert response.status_code == 302
         assert "/accounts/login/" in response.url
 
-    def test_get_edit_form_display(self, client, user):
+    def test_get_edit_form_display(self, auth_client, user):
         """Test that authenticated users can access the edit form."""
         meal = Meal.objects.create(
             occurred_at=timezone.now(),
@@ -931,27 +913,24 @@ class TestMealEditView:
             last_modified_by=user,
         )
         
-        client.force_login(user)
-        response = client.get(reverse("entries:meal_edit", args=[meal.pk]))
+        response = auth_client.get(reverse("entries:meal_edit", args=[meal.pk]))
         assert response.status_code == 200
         assert "form" in response.context
         assert response.context["title"] == "Edit Meal"
         assert response.context["meal"] == meal
-        assert "entries/meal_form.html" in [t.name for t in response.templates]
+        assert rendered(response, "entries/meal_form.html")
 
-    def test_edit_meal_success(self, client, user):
+    def test_edit_meal_success(self, auth_client, user):
         """Test successful meal update."""
         meal = Meal.objects.create(
             occurred_at=timezone.now(),
             meal_type="breakfast",
             description="Original breakfast",
-            total_carbs=Decimal("30.0"),
+            total_carbs=D_30_0,
             notes="Original note",
             last_modified_by=user,
         )
         
-        client.force_login(user)
-        
         new_time = timezone.now() + timezone.timedelta(hours=1)
         data = {
             "occurred_at": new_time.strftime("%Y-%m-%dT%H:%M"),
@@ -961,21 +940,20 @@ class TestMealEditView:
             "notes": "Updated note",
         }
         
-        response = client.post(reverse("entries:meal_edit", args=[meal.pk]), data)
+        response = auth_client.post(reverse("entries:meal_edit", args=[meal.pk]), data)
         
         # Should redirect to meals list
-        assert response.status_code == 302
-        assert response.url == reverse("entries:meals_list")
+        assert_redirects_to(response, MEALS_LIST_URL)
         
         # Meal should be updated
         meal.refresh_from_db()
         assert meal.meal_type == "lunch"
         assert meal.description == "Updated meal description"
-        assert meal.total_carbs == Decimal("45.5")
+        assert meal.total_carbs == D_45_5
         assert meal.notes == "Updated note"
         assert meal.last_modified_by == user
 
-    def test_cannot_edit_other_users_meal(self, client, user, second_user):
+    def test_cannot_edit_other_users_meal(self, auth_client, user, second_user):
         """Test that users cannot edit meals created by other users."""
         meal = Meal.objects.create(
             occurred_at=timezone.now(),
@@ -984,26 +962,19 @@ class TestMealEditView:
             last_modified_by=second_user,
         )
         
-        client.force_login(user)
-        response = client.get(reverse("entries:meal_edit", args=[meal.pk]))
+        response = auth_client.get(reverse("entries:meal_edit", args=[meal.pk]))
         
         # Should redirect to meals list with error
-        assert response.status_code == 302
-        assert response.url == reverse("entries:meals_list")
+        assert_redirects_to(response, MEALS_LIST_URL)
 
-    def test_edit_nonexistent_meal(self, client, user):
+    def test_edit_nonexistent_meal(self, auth_client):
         """Test editing a meal that doesn't exist."""
-        import uuid
-        fake_uuid = uuid.uuid4()
-        
-        client.force_login(user)
-        response = client.get(reverse("entries:meal_edit", args=[fake_uuid]))
+        response = auth_client.get(reverse("entries:meal_edit", args=[NONEXISTENT_PK]))
         
         # Should redirect to meals list with error
-        assert response.status_code == 302
-        assert response.url == reverse("entries:meals_list")
+        assert_redirects_to(response, MEALS_LIST_URL)
 
-    def test_edit_meal_invalid_data(self, client, user):
+    def test_edit_meal_invalid_data(self, auth_client, user, now_str):
         """Test that invalid form submission shows errors."""
         meal = Meal.objects.create(
             occurred_at=timezone.now(),
@@ -1012,15 +983,13 @@ class TestMealEditView:
             last_modified_by=user,
         )
         
-        client.force_login(user)
-        
         data = {
-            "occurred_at": timezone.now().strftime("%Y-%m-%dT%H:%M"),
+            "occurred_at": now_str,
             "meal_type": "invalid_type",
             "description": "Updated snack",
         }
         
-        response = client.post(reverse("entries:meal_edit", args=[meal.pk]), data)
+        response = auth_client.post(reverse("entries:meal_edit", args=[meal.pk]), data)
         
         # Should not redirect, show form with errors
         assert response.status_code == 200
@@ -1031,32 +1000,30 @@ class TestMealEditView:
         meal.refresh_from_db()
         assert meal.meal_type == "snack"
 
-    def test_edit_meal_remove_carbs(self, client, user):
+    def test_edit_meal_remove_carbs(self, auth_client, user, now_str):
         """Test that carbs can be removed when editing."""
         meal = Meal.objects.create(
             occurred_at=timezone.now(),
             meal_type="breakfast",
             description="Test meal",
-            total_carbs=Decimal("30.0"),
+            total_carbs=D_30_0,
             last_modified_by=user,
         )
         
-        client.force_login(user)
-        
         data = {
-            "occurred_at": timezone.now().strftime("%Y-%m-%dT%H:%M"),
+            "occurred_at": now_str,
             "meal_type": "breakfast",
             "description": "Test meal",
             "total_carbs": "",  # Empty to remove
         }
         
-        response = client.post(reverse("entries:meal_edit", args=[meal.pk]), data)
+        response = auth_client.post(reverse("entries:meal_edit", args=[meal.pk]), data)
         
         assert response.status_code == 302
         meal.refresh_from_db()
         assert meal.total_carbs is None
 
-    def test_edit_preserves_timestamps(self, client, user):
+    def test_edit_preserves_timestamps(self, auth_client, user, now_str):
         """Test that editing preserves created_at timestamp."""
         original_time = timezone.now() - timezone.timedelta(days=1)
         meal = Meal.objects.create(
@@ -1067,15 +1034,13 @@ class TestMealEditView:
         )
         original_created_at = meal.created_at
         
-        client.force_login(user)
-        
         data = {
-            "occurred_at": timezone.now().strftime("%Y-%m-%dT%H:%M"),
+            "occurred_at": now_str,
             "meal_type": "lunch",
             "description": "Updated meal",
         }
         
-        response = client.post(reverse("entries:meal_edit", args=[meal.pk]), data)
+        response = auth_client.post(reverse("entries:meal_edit", args=[meal.pk]), data)
         
         assert response.status_code == 302
         
@@ -1085,7 +1050,8 @@ class TestMealEditView:
         # but updated_at should be updated
         assert meal.updated_at > original_created_at
 
-    def test_edit_meal_change_type(self, client, user):
+    @pytest.mark.parametrize("new_type", ["lunch", "dinner", "snack"])
+    def test_edit_meal_change_type(self, auth_client, user, new_type, now_str):
         """Test changing meal type during edit."""
         meal = Meal.objects.create(
             occurred_at=timezone.now(),
@@ -1094,20 +1060,17 @@ class TestMealEditView:
             last_modified_by=user,
         )
         
-        client.force_login(user)
+        data = {
+            "occurred_at": now_str,
+            "meal_type": new_type,
+            "description": f"Changed to {new_type}",
+        }
+        
+        response = auth_client.post(reverse("entries:meal_edit", args=[meal.pk]), data)
+        assert response.status_code == 302
         
-        for new_type in ["lunch", "dinner", "snack"]:
-            data = {
-                "occurred_at": timezone.now().strftime("%Y-%m-%dT%H:%M"),
-                "meal_type": new_type,
-                "description": f"Changed to {new_type}",
-            }
-            
-            response = client.post(reverse("entries:meal_edit", args=[meal.pk]), data)
-            assert response.status_code == 302
-            
-            meal.refresh_from_db()
-            assert meal.meal_type == new_type
+        meal.refresh_from_db()
+        assert meal.meal_type == new_type
 
 
 @pytest.mark.django_db
@@ -1116,99 +1079,115 @@ class TestInsulinDosesListView:
 
     def test_view_requires_authentication(self, client):
         """Test that the view requires authentication."""
-        response = client.get(reverse("entries:insulin_doses_list"))
+        response = client.get(INSULIN_LIST_URL)
         # Should redirect to login
         assert response.status_code == 302
         assert "/accounts/login/" in response.url
 
-    def test_view_with_authenticated_user(self, client, user):
+    def test_view_with_authenticated_user(self, auth_client):
         """Test that authenticated users can access the view."""
-        client.force_login(user)
-        response = client.get(reverse("entries:insulin_doses_list"))
+        response = auth_client.get(INSULIN_LIST_URL)
         assert response.status_code == 200
-        assert "entries/insulin_doses_list.html" in [t.name for t in response.templates]
+        assert rendered(response, "entries/insulin_doses_list.html")
 
-    def test_pagination_default_page_size(self, client, user, insulin_type):
+    def test_pagination_default_page_size(self, auth_client, user, insulin_type):
         """Test that default page size is 50."""
-        client.force_login(user)
-        
         # Create 75 doses
-        for i in range(75):
-            InsulinDose.objects.create(
-                occurred_at=timezone.now() - timezone.timedelta(hours=i),
-                base_units=Decimal("10.0"),
-                correction_units=Decimal("0.0"),
-                insulin_type=insulin_type,
-                last_modified_by=user
-            )
-        
-        response = client.get(reverse("entries:insulin_doses_list"))
+        now = timezone.now()
+        InsulinDose.objects.bulk_create(
+            [
+                InsulinDose(
+                    occurred_at=now - timezone.timedelta(hours=i),
+                    base_units=D_10_0,
+                    correction_units=D_0_0,
+                    insulin_type=insulin_type,
+                    last_modified_by=user
+                )
+                for i in range(75)
+            ],
+            batch_size=500,
+        )
+        
+        response = auth_client.get(INSULIN_LIST_URL)
         assert response.status_code == 200
         assert len(response.context["page_obj"]) == 50
         assert response.context["page_size"] == 50
 
-    def test_pagination_custom_page_size(self, client, user, insulin_type):
+    @pytest.mark.parametrize("page_size,expected", [(10, 10), (25, 25), (50, 30), (100, 30)])
+    def test_pagination_custom_page_size(self, auth_client, user, insulin_type, page_size, expected):
         """Test custom page sizes."""
-        client.force_login(user)
-        
         # Create 30 doses
-        for i in range(30):
-            InsulinDose.objects.create(
-                occurred_at=timezone.now() - timezone.timedelta(hours=i),
-                base_units=Decimal("5.0"),
-                correction_units=Decimal("0.0"),
-                insulin_type=insulin_type,
-                last_modified_by=user
+        now = timezone.now()
+        InsulinDose.objects.bulk_create(
+            [
+                InsulinDose(
+                    occurred_at=now - timezone.timedelta(hours=i),
+                    base_units=D_5_0,
+                    correction_units=D_0_0,
+                    insulin_type=insulin_type,
+                    last_modified_by=user
+                )
+                for i in range(30)
+            ],
+            batch_size=500,
+        )
+        
+        response = auth_client.get(INSULIN_LIST_URL, {"page_size": page_size})
+        assert len(response.context["page_obj"]) == expected
+        assert response.context["page_size"] == page_size
+
+    @pytest.mark.parametrize("page_size", [10, 100])
+    def test_query_count_independent_of_page_size(
+        self, auth_client, user, insulin_type, django_assert_num_queries, page_size
+    ):
+        """Test that related rows are joined rather than fetched per dose."""
+        now = timezone.now()
+        InsulinDose.objects.bulk_create(
+            [
+                InsulinDose(
+                    occurred_at=now - timezone.timedelta(hours=i),
+                    base_units=D_10_0,
+                    correction_units=D_0_0,
+                    insulin_type=insulin_type,
+                    last_modified_by=user
+                )
+                for i in range(30)
+            ],
+            batch_size=500,
+        )
+
+        # User, count and page
+        with django_assert_num_queries(3):
+            response = auth_client.get(
+                INSULIN_LIST_URL, {"page_size": page_size}
             )
-        
-        # Test page_size=10
-        response = client.get(reverse("entries:insulin_doses_list"), {"page_size": 10})
-        assert len(response.context["page_obj"]) == 10
-        assert response.context["page_size"] == 10
-        
-        # Test page_size=25
-        response = client.get(reverse("entries:insulin_doses_list"), {"page_size": 25})
-        assert len(response.context["page_obj"]) == 25
-        assert response.context["page_size"] == 25
+        assert response.status_code == 200
 
-    def test_doses_ordered_by_occurred_at_desc(self, client, user, insulin_type):
+    def test_doses_ordered_by_occurred_at_desc(self, auth_client, user, insulin_type):
         """Test that doses are ordered by occurred_at descending."""
-        client.force_login(user)
-        
         # Create doses with different timestamps
-        dose1 = InsulinDose.objects.create(
-            occurred_at=timezone.now() - timezone.timedelta(hours=2),
-            base_units=Decimal("8.0"),
-            correction_units=Decimal("0.0"),
-            insulin_type=insulin_type,
-            last_modified_by=user
-        )
-        dose2 = InsulinDose.objects.create(
-            occurred_at=timezone.now() - timezone.timedelta(hours=1),
-            base_units=Decimal("6.0"),
-            correction_units=Decimal("0.0"),
-            insulin_type=insulin_type,
-            last_modified_by=user
-        )
-        dose3 = InsulinDose.objects.create(
-            occurred_at=timezone.now(),
-            base_units=Decimal("10.0"),
-            correction_units=Decimal("0.0"),
-            insulin_type=insulin_type,
-            last_modified_by=user
-        )
+        now = timezone.now()
+        dose1, dose2, dose3 = InsulinDose.objects.bulk_create([
+            InsulinDose(
+                occurred_at=now - timezone.timedelta(hours=hours),
+                base_units=units,
+                correction_units=D_0_0,
+                insulin_type=insulin_type,
+                last_modified_by=user
+            )
+            for hours, units in ((2, D_8_0), (1, D_6_0), (0, D_10_0))
+        ])
         
-        response = client.get(reverse("entries:insulin_doses_list"))
+        response = auth_client.get(INSULIN_LIST_URL)
         doses = list(response.context["page_obj"])
         
         assert doses[0].pk == dose3.pk
         assert doses[1].pk == dose2.pk
         assert doses[2].pk == dose1.pk
 
-    def test_empty_list_renders(self, client, user):
+    def test_empty_list_renders(self, auth_client):
         """Test that the view renders correctly with no doses."""
-        client.force_login(user)
-        response = client.get(reverse("entries:insulin_doses_list"))
+        response = auth_client.get(INSULIN_LIST_URL)
         assert response.status_code == 200
 
 
@@ -1218,111 +1197,95 @@ class TestInsulinDoseCreateView:
 
     def test_view_requires_authentication(self, client):
         """Test that the view requires authentication."""
-        response = client.get(reverse("entries:insulin_dose_create"))
+        response = client.get(INSULIN_CREATE_URL)
         assert response.status_code == 302
         assert "/accounts/login/" in response.url
 
-    def test_get_view_renders_form(self, client, user):
+    def test_get_view_renders_form(self, auth_client):
         """Test that GET request renders the form."""
-        client.force_login(user)
-        response = client.get(reverse("entries:insulin_dose_create"))
+        response = auth_client.get(INSULIN_CREATE_URL)
         assert response.status_code == 200
-        assert "entries/insulin_dose_form.html" in [t.name for t in response.templates]
+        assert rendered(response, "entries/insulin_dose_form.html")
         assert "form" in response.context
         assert response.context["title"] == "Add Insulin Dose"
 
-    def test_create_dose_with_required_fields(self, client, user, insulin_type):
+    def test_create_dose_with_required_fields(self, auth_client, user, insulin_type, now_str):
         """Test creating a dose with only required fields."""
-        client.force_login(user)
-        
         data = {
-            "occurred_at": timezone.now().strftime("%Y-%m-%dT%H:%M"),
+            "occurred_at": now_str,
             "base_units": "12.5",
             "correction_units": "0.0",
             "insulin_type": insulin_type.pk,
         }
         
-        response = client.post(reverse("entries:insulin_dose_create"), data)
-        assert response.status_code == 302
-        assert response.url == reverse("entries:insulin_doses_list")
+        response = auth_client.post(INSULIN_CREATE_URL, data)
+        assert_redirects_to(response, INSULIN_LIST_URL)
         
         # Verify dose was created
-        dose = InsulinDose.objects.first()
-        assert dose is not None
+        dose = sole(InsulinDose.objects.all())
         assert dose.base_units == Decimal("12.5")
-        assert dose.correction_units == Decimal("0.0")
+        assert dose.correction_units == D_0_0
         assert dose.insulin_type == insulin_type
         assert dose.last_modified_by == user
         assert dose.notes is None
 
-    def test_create_dose_with_all_fields(self, client, user, insulin_type):
+    def test_create_dose_with_all_fields(self, auth_client, insulin_type, now_str):
         """Test creating a dose with all fields."""
-        client.force_login(user)
-        
         data = {
-            "occurred_at": timezone.now().strftime("%Y-%m-%dT%H:%M"),
+            "occurred_at": now_str,
             "base_units": "15.0",
             "correction_units": "3.5",
             "insulin_type": insulin_type.pk,
             "notes": "Before dinner",
         }
         
-        response = client.post(reverse("entries:insulin_dose_create"), data)
+        response = auth_client.post(INSULIN_CREATE_URL, data)
         assert response.status_code == 302
         
-        dose = InsulinDose.objects.first()
+        dose = sole(InsulinDose.objects.all())
         assert dose.base_units == Decimal("15.0")
         assert dose.correction_units == Decimal("3.5")
         assert dose.notes == "Before dinner"
 
-    def test_create_dose_missing_required_field(self, client, user):
+    def test_create_dose_missing_required_field(self, auth_client, now_str):
         """Test that missing required fields cause validation errors."""
-        client.force_login(user)
-        
         # Missing insulin_type
         data = {
-            "occurred_at": timezone.now().strftime("%Y-%m-%dT%H:%M"),
+            "occurred_at": now_str,
             "base_units": "10.0",
             "correction_units": "0.0",
         }
         
-        response = client.post(reverse("entries:insulin_dose_create"), data)
+        response = auth_client.post(INSULIN_CREATE_URL, data)
         assert response.status_code == 200  # Form re-rendered with errors
         assert "form" in response.context
         assert response.context["form"].errors
 
-    def test_create_dose_invalid_units(self, client, user, insulin_type):
+    def test_create_dose_invalid_units(self, auth_client, insulin_type, now_str):
         """Test validation for invalid units."""
-        client.force_login(user)
-        
         data = {
-            "occurred_at": timezone.now().strftime("%Y-%m-%dT%H:%M"),
+            "occurred_at": now_str,
             "base_units": "invalid",
             "correction_units": "0.0",
             "insulin_type": insulin_type.pk,
         }
         
-        response = client.post(reverse("entries:insulin_dose_create"), data)
+        response = auth_client.post(INSULIN_CREATE_URL, data)
         assert response.status_code == 200
         assert "form" in response.context
         assert response.context["form"].errors
 
-    def test_default_insulin_type_auto_selected(self, client, user):
+    def test_default_insulin_type_auto_selected(self, auth_client, user):
         """Test that the default insulin type is automatically selected in the form."""
-        from entries.models import InsulinType
-        from base.middleware import set_current_user
-        
         # Create a default insulin type
-        set_current_user(user)
-        default_type = InsulinType.objects.create(
-            name="Default Type",
-            type=InsulinType.Type.RAPID_ACTING,
-            is_default=True
-        )
-        set_current_user(None)
+        with acting_as(user):
+            default_type = InsulinType.objects.create(
+                name="Default Type",
+                type=InsulinType.Type.RAPID_ACTING,
+                is_default=True
+            )
         
-        client.force_login(user)
-        response = client.get(reverse("entries:insulin_dose_create"))
+        response = auth_client.get(INSULIN_CREATE_URL)
         
         assert response.status_code == 200
         assert "form" in response.context
@@ -1340,8 +1303,8 @@ class TestInsulinDoseEditView:
         """Test that the view requires authentication."""
         dose = InsulinDose.objects.create(
             occurred_at=timezone.now(),
-            base_units=Decimal("10.0"),
-            correction_units=Decimal("0.0"),
+            base_units=D_10_0,
+            correction_units=D_0_0,
             insulin_type=insulin_type,
             last_modified_by=user
         )
@@ -1349,10 +1312,8 @@ class TestInsulinDoseEditView:
         assert response.status_code == 302
         assert "/accounts/login/" in response.url
 
-    def test_get_view_renders_form(self, client, user, insulin_type):
+    def test_get_view_renders_form(self, auth_client, user, insulin_type):
         """Test that GET request renders the form with existing data."""
-        client.force_login(user)
-        
         dose = InsulinDose.objects.create(
             occurred_at=timezone.now(),
             base_units=Decimal("8.5"),
@@ -1362,21 +1323,19 @@ class TestInsulinDoseEditView:
             last_modified_by=user
         )
         
-        response = client.get(reverse("entries:insulin_dose_edit", args=[dose.pk]))
+        response = auth_client.get(reverse("entries:insulin_dose_edit", args=[dose.pk]))
         assert response.status_code == 200
-        assert "entries/insulin_dose_form.html" in [t.name for t in response.templates]
+        assert rendered(response, "entries/insulin_dose_form.html")
         assert "form" in response.context
         assert response.context["title"] == "Edit Insulin Dose"
         assert response.context["dose"] == dose
 
-    def test_update_dose(self, client, user, insulin_type):
+    def test_update_dose(self, auth_client, user, insulin_type):
         """Test updating a dose."""
-        client.force_login(user)
-        
         dose = InsulinDose.objects.create(
             occurred_at=timezone.now(),
-            base_units=Decimal("10.0"),
-            correction_units=Decimal("0.0"),
+            base_units=D_10_0,
+            correction_units=D_0_0,
             insulin_type=insulin_type,
             last_modified_by=user
         )
@@ -1390,90 +1349,78 @@ class TestInsulinDoseEditView:
             "notes": "Updated notes",
         }
         
-        response = client.post(reverse("entries:insulin_dose_edit", args=[dose.pk]), data)
-        assert response.status_code == 302
-        assert response.url == reverse("entries:insulin_doses_list")
+        response = auth_client.post(reverse("entries:insulin_dose_edit", args=[dose.pk]), data)
+        assert_redirects_to(response, INSULIN_LIST_URL)
         
         dose.refresh_from_db()
-        assert dose.base_units == Decimal("12.0")
-        assert dose.correction_units == Decimal("2.0")
+        assert dose.base_units == D_12_0
+        assert dose.correction_units == D_2_0
         assert dose.notes == "Updated notes"
         assert dose.last_modified_by == user
 
-    def test_user_can_only_edit_own_dose(self, client, user, another_user, insulin_type):
+    def test_user_can_only_edit_own_dose(self, auth_client, user, another_user, insulin_type):
         """Test that users can only edit their own doses."""
-        client.force_login(user)
-        
         # Create dose by another user
         dose = InsulinDose.objects.create(
             occurred_at=timezone.now(),
-            base_units=Decimal("10.0"),
-            correction_units=Decimal("0.0"),
+            base_units=D_10_0,
+            correction_units=D_0_0,
             insulin_type=insulin_type,
             last_modified_by=another_user
         )
         
-        response = client.get(reverse("entries:insulin_dose_edit", args=[dose.pk]))
+        response = auth_client.get(reverse("entries:insulin_dose_edit", args=[dose.pk]))
         assert response.status_code == 404
 
-    def test_nonexistent_dose_returns_404(self, client, user):
+    def test_nonexistent_dose_returns_404(self, auth_client):
         """Test that editing a nonexistent dose returns 404."""
-        client.force_login(user)
-        
-        from uuid import uuid4
-        fake_uuid = uuid4()
-        
-        response = client.get(reverse("entries:insulin_dose_edit", args=[fake_uuid]))
+        response = auth_client.get(reverse("entries:insulin_dose_edit", args=[NONEXISTENT_PK]))
         assert response.status_code == 404
 
-    def test_update_dose_validation_errors(self, client, user, insulin_type):
+    def test_update_dose_validation_errors(self, auth_client, user, insulin_type, now_str):
         """Test that validation errors are handled properly."""
-        client.force_login(user)
-        
         dose = InsulinDose.objects.create(
             occurred_at=timezone.now(),
-            base_units=Decimal("10.0"),
-            correction_units=Decimal("0.0"),
+            base_units=D_10_0,
+            correction_units=D_0_0,
             insulin_type=insulin_type,
             last_modified_by=user
         )
         
         # Submit invalid data
         data = {
-            "occurred_at": timezone.now().strftime("%Y-%m-%dT%H:%M"),
+            "occurred_at": now_str,
             "base_units": "",  # Empty base_units
             "correction_units": "0.0",
             "insulin_type": insulin_type.pk,
         }
         
-        response = client.post(reverse("entries:insulin_dose_edit", args=[dose.pk]), data)
+        response = auth_client.post(reverse("entries:insulin_dose_edit", args=[dose.pk]), data)
         assert response.status_code == 200
         assert "form" in response.context
         assert response.context["form"].errors
 
-    def test_switch_insulin_type(self, client, user, insulin_type):
+    def test_switch_insulin_type(self, auth_client, user, insulin_type, now_str):
         """Test changing insulin type on an existing dose."""
-        client.force_login(user)
-        
         # Create second insulin type
         new_type = InsulinType.objects.create(name="Long-acting")
         
         dose = InsulinDose.objects.create(
             occurred_at=timezone.now(),
-            base_units=Decimal("10.0"),
-            correction_units=Decimal("0.0"),
+            base_units=D_10_0,
+            correction_units=D_0_0,
             insulin_type=insulin_type,
             last_modified_by=user
         )
         
         data = {
-            "occurred_at": timezone.now().strftime("%Y-%m-%dT%H:%M"),
+            "occurred_at": now_str,
             "base_units": "10.0",
             "correction_units": "0.0",
             "insulin_type": new_type.pk,
         }
         
-        response = client.post(reverse("entries:insulin_dose_edit", args=[dose.pk]), data)
+        response = auth_client.post(reverse("entries:insulin_dose_edit", args=[dose.pk]), data)
         assert response.status_code == 302
         
         dose.refresh_from_db()
@@ -1486,21 +1433,20 @@ class TestActivityView:
 
     def test_view_requires_authentication(self, client):
         """Test that the view requires authentication."""
-        response = client.get(reverse("entries:activity"))
+        response = client.get(ACTIVITY_URL)
         assert response.status_code == 302
         assert "/accounts/login/" in response.url
 
-    def test_view_with_authenticated_user(self, client, user):
+    def test_view_with_authenticated_user(self, auth_client):
         """Test that authenticated users can access the activity view."""
-        client.force_login(user)
-        response = client.get(reverse("entries:activity"))
+        response = auth_client.get(ACTIVITY_URL)
         assert response.status_code == 200
-        assert "entries/activity.html" in [t.name for t in response.templates]
+        assert rendered(response, "entries/activity.html")
 
-    def test_activity_combines_all_entry_types(self, client, user, insulin_type):
+    def test_activity_combines_all_entry_types(
+        self, auth_client, user, insulin_type, django_assert_num_queries
+    ):
         """Test that activity view combines glucose readings, insulin doses, and meals."""
-        client.force_login(user)
-        
         # Create entries with different times
         now = timezone.now()
         
@@ -1513,8 +1459,8 @@ class TestActivityView:
         
         dose = InsulinDose.objects.create(
             occurred_at=now - timezone.timedelta(hours=2),
-            base_units=Decimal("10.0"),
-            correction_units=Decimal("0.0"),
+            base_units=D_10_0,
+            correction_units=D_0_0,
             insulin_type=insulin_type,
             last_modified_by=user
         )
@@ -1526,7 +1472,9 @@ class TestActivityView:
             last_modified_by=user
         )
         
-        response = client.get(reverse("entries:activity"))
+        # User, readings, doses and meals
+        with django_assert_num_queries(4):
+            response = auth_client.get(ACTIVITY_URL)
         assert response.status_code == 200
         
         # Check all entries are in the page
@@ -1538,10 +1486,10 @@ class TestActivityView:
         assert entries[1].pk == dose.pk
         assert entries[2].pk == glucose.pk
 
-    def test_activity_sorted_by_occurred_at_desc(self, client, user, insulin_type):
+    def test_activity_sorted_by_occurred_at_desc(
+        self, auth_client, user, insulin_type, django_assert_num_queries
+    ):
         """Test that activity is sorted by occurred_at in descending order."""
-        client.force_login(user)
-        
         now = timezone.now()
         
         # Create entries in mixed order
@@ -1554,8 +1502,8 @@ class TestActivityView:
         
         recent_dose = InsulinDose.objects.create(
             occurred_at=now - timezone.timedelta(hours=1),
-            base_units=Decimal("10.0"),
-            correction_units=Decimal("0.0"),
+            base_units=D_10_0,
+            correction_units=D_0_0,
             insulin_type=insulin_type,
             last_modified_by=user
         )
@@ -1567,7 +1515,9 @@ class TestActivityView:
             last_modified_by=user
         )
         
-        response = client.get(reverse("entries:activity"))
+        # User, readings, doses and meals
+        with django_assert_num_queries(4):
+            response = auth_client.get(ACTIVITY_URL)
         entries = list(response.context["page_obj"])
         
         # Verify order: newest first
@@ -1575,133 +1525,107 @@ class TestActivityView:
         assert entries[1].pk == middle_meal.pk
         assert entries[2].pk == old_glucose.pk
 
-    def test_today_filter(self, client, user, insulin_type):
+    def test_today_filter(self, auth_client, user, insulin_type):
         """Test filtering activity for today."""
-        client.force_login(user)
-        
         today = timezone.now().date()
-        yesterday = today - timezone.timedelta(days=1)
         today_str = today.strftime("%Y-%m-%d")
-        
-        # Create today's entry
-        today_reading = GlucoseReading.objects.create(
-            occurred_at=timezone.make_aware(timezone.datetime.combine(today, timezone.datetime.min.time()) + timezone.timedelta(hours=10)),
-            value=5.5,
-            unit="mmol/L",
-            last_modified_by=user
+        today_10 = timezone.datetime(
+            today.year, today.month, today.day, 10, tzinfo=timezone.get_current_timezone()
         )
         
-        # Create yesterday's entry
-        yesterday_reading = GlucoseReading.objects.create(
-            occurred_at=timezone.make_aware(timezone.datetime.combine(yesterday, timezone.datetime.min.time()) + timezone.timedelta(hours=10)),
-            value=6.0,
-            unit="mmol/L",
-            last_modified_by=user
-        )
+        today_reading, yesterday_reading = GlucoseReading.objects.bulk_create([
+            GlucoseReading(
+                occurred_at=today_10 - timezone.timedelta(days=days),
+                value=value,
+                unit="mmol/L",
+                last_modified_by=user
+            )
+            for days, value in ((0, 5.5), (1, 6.0))
+        ])
         
-        response = client.get(reverse("entries:activity"), {"start_date": today_str, "end_date": today_str})
+        response = auth_client.get(ACTIVITY_URL, {"start_date": today_str, "end_date": today_str})
         assert response.status_code == 200
         
         entries = list(response.context["page_obj"])
         assert len(entries) == 1
         assert entries[0].pk == today_reading.pk
 
-    def test_two_days_filter(self, client, user, insulin_type):
+    def test_two_days_filter(self, auth_client, user, insulin_type):
         """Test filtering activity for yesterday and today (2 days)."""
-        client.force_login(user)
-        
         today = timezone.now().date()
         yesterday = today - timezone.timedelta(days=1)
-        two_days_ago = today - timezone.timedelta(days=2)
         
         today_str = today.strftime("%Y-%m-%d")
         yesterday_str = yesterday.strftime("%Y-%m-%d")
-        
-        # Create today's entry
-        today_reading = GlucoseReading.objects.create(
-            occurred_at=timezone.make_aware(timezone.datetime.combine(today, timezone.datetime.min.time()) + timezone.timedelta(hours=10)),
-            value=5.5,
-            unit="mmol/L",
-            last_modified_by=user
+        today_10 = timezone.datetime(
+            today.year, today.month, today.day, 10, tzinfo=timezone.get_current_timezone()
         )
         
-        # Create yesterday's entry
-        yesterday_reading = GlucoseReading.objects.create(
-            occurred_at=timezone.make_aware(timezone.datetime.combine(yesterday, timezone.datetime.min.time()) + timezone.timedelta(hours=10)),
-            value=6.0,
-            unit="mmol/L",
-            last_modified_by=user
-        )
-        
-        # Create two days ago entry
-        two_days_ago_reading = GlucoseReading.objects.create(
-            occurred_at=timezone.make_aware(timezone.datetime.combine(two_days_ago, timezone.datetime.min.time()) + timezone.timedelta(hours=10)),
-            value=6.5,
-            unit="mmol/L",
-            last_modified_by=user
-        )
+        today_reading, yesterday_reading, two_days_ago_reading = GlucoseReading.objects.bulk_create([
+            GlucoseReading(
+                occurred_at=today_10 - timezone.timedelta(days=days),
+                value=value,
+                unit="mmol/L",
+                last_modified_by=user
+            )
+            for days, value in ((0, 5.5), (1, 6.0), (2, 6.5))
+        ])
         
-        response = client.get(reverse("entries:activity"), {"start_date": yesterday_str, "end_date": today_str})
+        response = auth_client.get(ACTIVITY_URL, {"start_date": yesterday_str, "end_date": today_str})
         assert response.status_code == 200
         
         entries = list(response.context["page_obj"])
         assert len(entries) == 2
         assert {e.pk for e in entries} == {today_reading.pk, yesterday_reading.pk}
 
-    def test_custom_date_range_filter(self, client, user):
+    def test_custom_date_range_filter(self, auth_client, user):
         """Test filtering activity with custom date range."""
-        client.force_login(user)
-        
         # Create entries across multiple days
         base_date = timezone.now().date() - timezone.timedelta(days=10)
-        
-        old_reading = GlucoseReading.objects.create(
-            occurred_at=timezone.make_aware(timezone.datetime.combine(base_date, timezone.datetime.min.time())),
-            value=5.0,
-            unit="mmol/L",
-            last_modified_by=user
+        base_midnight = timezone.datetime(
+            base_date.year, base_date.month, base_date.day, tzinfo=timezone.get_current_timezone()
         )
         
-        middle_reading = GlucoseReading.objects.create(
-            occurred_at=timezone.make_aware(timezone.datetime.combine(base_date + timezone.timedelta(days=5), timezone.datetime.min.time())),
-            value=5.5,
-            unit="mmol/L",
-            last_modified_by=user
-        )
-        
-        recent_reading = GlucoseReading.objects.create(
-            occurred_at=timezone.make_aware(timezone.datetime.combine(base_date + timezone.timedelta(days=9), timezone.datetime.min.time())),
-            value=6.0,
-            unit="mmol/L",
-            last_modified_by=user
-        )
+        old_reading, middle_reading, recent_reading = GlucoseReading.objects.bulk_create([
+            GlucoseReading(
+                occurred_at=base_midnight + timezone.timedelta(days=days),
+                value=value,
+                unit="mmol/L",
+                last_modified_by=user
+            )
+            for days, value in ((0, 5.0), (5, 5.5), (9, 6.0))
+        ])
         
         # Filter for middle range
         start = (base_date + timezone.timedelta(days=3)).strftime("%Y-%m-%d")
         end = (base_date + timezone.timedelta(days=7)).strftime("%Y-%m-%d")
         
-        response = client.get(f"{reverse('entries:activity')}?start_date={start}&end_date={end}")
+        response = auth_client.get(ACTIVITY_URL, {"start_date": start, "end_date": end})
         assert response.status_code == 200
         
         entries = list(response.context["page_obj"])
         assert len(entries) == 1
         assert entries[0].pk == middle_reading.pk
 
-    def test_pagination(self, client, user):
+    def test_pagination(self, auth_client, user):
         """Test pagination of activity entries."""
-        client.force_login(user)
-        
         # Create 15 glucose readings
-        for i in range(15):
-            GlucoseReading.objects.create(
-                occurred_at=timezone.now() - timezone.timedelta(hours=i),
-                value=5.0 + i * 0.1,
-                unit="mmol/L",
-                last_modified_by=user
-            )
+        now = timezone.now()
+        GlucoseReading.objects.bulk_create(
+            [
+                GlucoseReading(
+                    occurred_at=now - timezone.timedelta(hours=i),
+                    value=5.0 + i * 0.1,
+                    unit="mmol/L",
+                    last_modified_by=user
+                )
+                for i in range(15)
+            ],
+            batch_size=500,
+        )
         
         # Request with page size of 10
-        response = client.get(reverse("entries:activity") + "?page_size=10")
+        response = auth_client.get(ACTIVITY_URL, {"page_size": 10})
         assert response.status_code == 200
         
         page_obj = response.context["page_obj"]
@@ -1709,20 +1633,18 @@ class TestActivityView:
         assert page_obj.has_next()
         assert page_obj.paginator.num_pages == 2
 
-    def test_empty_activity_list(self, client, user):
+    def test_empty_activity_list(self, auth_client):
         """Test activity view with no entries."""
-        client.force_login(user)
-        
-        response = client.get(reverse("entries:activity"))
+        response = auth_client.get(ACTIVITY_URL)
         assert response.status_code == 200
         
         entries = list(response.context["page_obj"])
         assert len(entries) == 0
 
-    def test_entry_type_attributes(self, client, user, insulin_type):
+    def test_entry_type_attributes(
+        self, auth_client, user, insulin_type, django_assert_num_queries
+    ):
         """Test that entries have correct entry_type attributes."""
-        client.force_login(user)
-        
         now = timezone.now()
         
         glucose = GlucoseReading.objects.create(
@@ -1734,8 +1656,8 @@ class TestActivityView:
         
         dose = InsulinDose.objects.create(
             occurred_at=now - timezone.timedelta(hours=2),
-            base_units=Decimal("10.0"),
-            correction_units=Decimal("0.0"),
+            base_units=D_10_0,
+            correction_units=D_0_0,
             insulin_type=insulin_type,
             last_modified_by=user
         )
@@ -1747,17 +1669,16 @@ class TestActivityView:
             last_modified_by=user
         )
         
-        response = client.get(reverse("entries:activity"))
+        # User, readings, doses and meals
+        with django_assert_num_queries(4):
+            response = auth_client.get(ACTIVITY_URL)
         entries = list(response.context["page_obj"])
         
         # Find each entry and check its type
-        meal_entry = next(e for e in entries if e.pk == meal.pk)
-        dose_entry = next(e for e in entries if e.pk == dose.pk)
-        glucose_entry = next(e for e in entries if e.pk == glucose.pk)
-        
-        assert meal_entry.entry_type == "meal"
-        assert dose_entry.entry_type == "insulin"
-        assert glucose_entry.entry_type == "glucose"
+        by_pk = {e.pk: e for e in entries}
+        assert by_pk[meal.pk].entry_type == "meal"
+        assert by_pk[dose.pk].entry_type == "insulin"
+        assert by_pk[glucose.pk].entry_type == "glucose"
 
 
 @pytest.mark.django_db
@@ -1766,47 +1687,28 @@ class TestInsulinSchedulesListView:
 
     def test_view_requires_authentication(self, client):
         """Test that the view requires authentication."""
-        response = client.get(reverse("entries:insulin_schedules_list"))
+        response = client.get(SCHEDULES_LIST_URL)
         assert response.status_code == 302
         assert "/accounts/login/" in response.url
 
-    def test_view_with_authenticated_user(self, client, user):
+    def test_view_with_authenticated_user(self, auth_client):
         """Test that authenticated users can access the schedules list."""
-        client.force_login(user)
-        response = client.get(reverse("entries:insulin_schedules_list"))
+        response = auth_client.get(SCHEDULES_LIST_URL)
         assert response.status_code == 200
-        assert "entries/insulin_schedules_list.html" in [t.name for t in response.templates]
+        assert rendered(response, "entries/insulin_schedules_list.html")
 
-    def test_schedules_ordered_by_time(self, client, user, insulin_type):
+    def test_schedules_ordered_by_time(
+        self, auth_client, insulin_type, django_assert_num_queries
+    ):
         """Test that schedules are ordered by time."""
-        from entries.models import InsulinSchedule
-        from datetime import time as dt_time
-        
-        client.force_login(user)
-        
         # Create schedules in mixed order
-        evening = InsulinSchedule.objects.create(
-            label="Evening",
-            time=dt_time(20, 0),
-            insulin_type=insulin_type,
-            units=15.0
-        )
-        
-        morning = InsulinSchedule.objects.create(
-            label="Morning",
-            time=dt_time(8, 0),
-            insulin_type=insulin_type,
-            units=10.0
-        )
+        evening = make_schedule(insulin_type, label="Evening", time=dt_time(20, 0), units=15.0)
+        morning = make_schedule(insulin_type, label="Morning")
+        afternoon = make_schedule(insulin_type, label="Afternoon", time=dt_time(14, 0), units=12.0)
         
-        afternoon = InsulinSchedule.objects.create(
-            label="Afternoon",
-            time=dt_time(14, 0),
-            insulin_type=insulin_type,
-            units=12.0
-        )
-        
-        response = client.get(reverse("entries:insulin_schedules_list"))
+        # User and schedules joined with their insulin type
+        with django_assert_num_queries(2):
+            response = auth_client.get(SCHEDULES_LIST_URL)
         schedules = list(response.context["schedules"])
         
         # Verify order: earliest time first
@@ -1814,11 +1716,9 @@ class TestInsulinSchedulesListView:
         assert schedules[1].pk == afternoon.pk
         assert schedules[2].pk == evening.pk
 
-    def test_empty_schedules_list(self, client, user):
+    def test_empty_schedules_list(self, auth_client):
         """Test view with no schedules."""
-        client.force_login(user)
-        
-        response = client.get(reverse("entries:insulin_schedules_list"))
+        response = auth_client.get(SCHEDULES_LIST_URL)
         assert response.status_code == 200
         
         schedules = list(response.context["schedules"])
@@ -1831,25 +1731,20 @@ class TestInsulinScheduleCreateView:
 
     def test_view_requires_authentication(self, client):
         """Test that the view requires authentication."""
-        response = client.get(reverse("entries:insulin_schedule_create"))
+        response = client.get(SCHEDULE_CREATE_URL)
         assert response.status_code == 302
         assert "/accounts/login/" in response.url
 
-    def test_get_view_renders_form(self, client, user):
+    def test_get_view_renders_form(self, auth_client):
         """Test that GET request renders the form."""
-        client.force_login(user)
-        response = client.get(reverse("entries:insulin_schedule_create"))
+        response = auth_client.get(SCHEDULE_CREATE_URL)
         assert response.status_code == 200
-        assert "entries/insulin_schedule_form.html" in [t.name for t in response.templates]
+        assert rendered(response, "entries/insulin_schedule_form.html")
         assert "form" in response.context
         assert response.context["title"] == "Add Insulin Schedule"
 
-    def test_create_schedule_with_required_fields(self, client, user, insulin_type):
+    def test_create_schedule_with_required_fields(self, auth_client, insulin_type):
         """Test creating a schedule with only required fields."""
-        from entries.models import InsulinSchedule
-        
-        client.force_login(user)
-        
         data = {
             "label": "Morning dose",
             "time": "08:00",
@@ -1857,24 +1752,18 @@ class TestInsulinScheduleCreateView:
             "units": "10.5",
         }
         
-        response = client.post(reverse("entries:insulin_schedule_create"), data)
-        assert response.status_code == 302
-        assert response.url == reverse("entries:insulin_schedules_list")
+        response = auth_client.post(SCHEDULE_CREATE_URL, data)
+        assert_redirects_to(response, SCHEDULES_LIST_URL)
         
         # Verify schedule was created
-        schedule = InsulinSchedule.objects.first()
-        assert schedule is not None
+        schedule = sole(InsulinSchedule.objects.all())
         assert schedule.label == "Morning dose"
-        assert schedule.units == Decimal("10.5")
+        assert schedule.units == D_10_5
         assert schedule.insulin_type == insulin_type
         assert schedule.notes is None
 
-    def test_create_schedule_with_all_fields(self, client, user, insulin_type):
+    def test_create_schedule_with_all_fields(self, auth_client, insulin_type):
         """Test creating a schedule with all fields."""
-        from entries.models import InsulinSchedule
-        
-        client.force_login(user)
-        
         data = {
             "label": "Evening dose",
             "time": "20:00",
@@ -1883,17 +1772,15 @@ class TestInsulinScheduleCreateView:
             "notes": "Before dinner",
         }
         
-        response = client.post(reverse("entries:insulin_schedule_create"), data)
+        response = auth_client.post(SCHEDULE_CREATE_URL, data)
         assert response.status_code == 302
         
-        schedule = InsulinSchedule.objects.first()
+        schedule = sole(InsulinSchedule.objects.all())
         assert schedule.label == "Evening dose"
         assert schedule.notes == "Before dinner"
 
-    def test_create_schedule_missing_required_field(self, client, user):
+    def test_create_schedule_missing_required_field(self, auth_client):
         """Test that missing required fields cause validation errors."""
-        client.force_login(user)
-        
         # Missing time
         data = {
             "label": "Test",
@@ -1901,15 +1788,13 @@ class TestInsulinScheduleCreateView:
             "units": "10.0",
         }
         
-        response = client.post(reverse("entries:insulin_schedule_create"), data)
+        response = auth_client.post(SCHEDULE_CREATE_URL, data)
         assert response.status_code == 200  # Form re-rendered with errors
         assert "form" in response.context
         assert response.context["form"].errors
 
-    def test_create_schedule_invalid_units(self, client, user, insulin_type):
+    def test_create_schedule_invalid_units(self, auth_client, insulin_type):
         """Test validation for invalid units."""
-        client.force_login(user)
-        
         data = {
             "label": "Test",
             "time": "08:00",
@@ -1917,7 +1802,7 @@ class TestInsulinScheduleCreateView:
             "units": "invalid",
         }
         
-        response = client.post(reverse("entries:insulin_schedule_create"), data)
+        response = auth_client.post(SCHEDULE_CREATE_URL, data)
         assert response.status_code == 200
         assert "form" in response.context
         assert response.context["form"].errors
@@ -1929,55 +1814,26 @@ class TestInsulinScheduleEditView:
 
     def test_view_requires_authentication(self, client, insulin_type):
         """Test that the view requires authentication."""
-        from entries.models import InsulinSchedule
-        from datetime import time as dt_time
-        
-        schedule = InsulinSchedule.objects.create(
-            label="Test",
-            time=dt_time(8, 0),
-            insulin_type=insulin_type,
-            units=10.0
-        )
+        schedule = make_schedule(insulin_type)
         
         response = client.get(reverse("entries:insulin_schedule_edit", args=[schedule.pk]))
         assert response.status_code == 302
         assert "/accounts/login/" in response.url
 
-    def test_get_view_renders_form(self, client, user, insulin_type):
+    def test_get_view_renders_form(self, auth_client, insulin_type):
         """Test that GET request renders the form with existing data."""
-        from entries.models import InsulinSchedule
-        from datetime import time as dt_time
+        schedule = make_schedule(insulin_type, label="Morning dose", notes="Before breakfast")
         
-        client.force_login(user)
-        
-        schedule = InsulinSchedule.objects.create(
-            label="Morning dose",
-            time=dt_time(8, 0),
-            insulin_type=insulin_type,
-            units=10.0,
-            notes="Before breakfast"
-        )
-        
-        response = client.get(reverse("entries:insulin_schedule_edit", args=[schedule.pk]))
+        response = auth_client.get(reverse("entries:insulin_schedule_edit", args=[schedule.pk]))
         assert response.status_code == 200
-        assert "entries/insulin_schedule_form.html" in [t.name for t in response.templates]
+        assert rendered(response, "entries/insulin_schedule_form.html")
         assert "form" in response.context
         assert response.context["title"] == "Edit Insulin Schedule"
         assert response.context["schedule"] == schedule
 
-    def test_update_schedule(self, client, user, insulin_type):
+    def test_update_schedule(self, auth_client, insulin_type):
         """Test updating a schedule."""
-        from entries.models import InsulinSchedule
-        from datetime import time as dt_time
-        
-        client.force_login(user)
-        
-        schedule = InsulinSchedule.objects.create(
-            label="Morning dose",
-            time=dt_time(8, 0),
-            insulin_type=insulin_type,
-            units=10.0
-        )
+        schedule = make_schedule(insulin_type, label="Morning dose")
         
         data = {
             "label": "Updated Morning dose",
@@ -1987,28 +1843,17 @@ class TestInsulinScheduleEditView:
             "notes": "Updated notes",
         }
         
-        response = client.post(reverse("entries:insulin_schedule_edit", args=[schedule.pk]), data)
-        assert response.status_code == 302
-        assert response.url == reverse("entries:insulin_schedules_list")
+        response = auth_client.post(reverse("entries:insulin_schedule_edit", args=[schedule.pk]), data)
+        assert_redirects_to(response, SCHEDULES_LIST_URL)
         
         schedule.refresh_from_db()
         assert schedule.label == "Updated Morning dose"
-        assert schedule.units == Decimal("12.0")
+        assert schedule.units == D_12_0
         assert schedule.notes == "Updated notes"
 
-    def test_update_schedule_validation_errors(self, client, user, insulin_type):
+    def test_update_schedule_validation_errors(self, auth_client, insulin_type):
         """Test that validation errors are displayed on update."""
-        from entries.models import InsulinSchedule
-        from datetime import time as dt_time
-        
-        client.force_login(user)
-        
-        schedule = InsulinSchedule.objects.create(
-            label="Test",
-            time=dt_time(8, 0),
-            insulin_type=insulin_type,
-            units=10.0
-        )
+        schedule = make_schedule(insulin_type)
         
         data = {
             "label": "",  # Empty label should fail
@@ -2017,40 +1862,23 @@ class TestInsulinScheduleEditView:
             "units": "10.0",
         }
         
-        response = client.post(reverse("entries:insulin_schedule_edit", args=[schedule.pk]), data)
+        response = auth_client.post(reverse("entries:insulin_schedule_edit", args=[schedule.pk]), data)
         assert response.status_code == 200
         assert "form" in response.context
         assert response.context["form"].errors
 
-    def test_nonexistent_schedule_returns_404(self, client, user):
+    def test_nonexistent_schedule_returns_404(self, auth_client):
         """Test that editing a non-existent schedule returns 404."""
-        import uuid
-        
-        client.force_login(user)
-        
-        fake_uuid = uuid.uuid4()
-        response = client.get(reverse("entries:insulin_schedule_edit", args=[fake_uuid]))
+        response = auth_client.get(reverse("entries:insulin_schedule_edit", args=[NONEXISTENT_PK]))
         assert response.status_code == 404
 
-    def test_switch_insulin_type(self, client, user, insulin_type):
+    def test_switch_insulin_type(self, auth_client, user, insulin_type):
         """Test changing insulin type on an existing schedule."""
-        from entries.models import InsulinSchedule, InsulinType
-        from datetime import time as dt_time
-        from base.middleware import set_current_user
-        
-        client.force_login(user)
-        
         # Create second insulin type
-        set_current_user(user)
-        new_type = InsulinType.objects.create(name="Long-acting", type="long")
-        set_current_user(None)
+        with acting_as(user):
+            new_type = InsulinType.objects.create(name="Long-acting", type="long")
         
-        schedule = InsulinSchedule.objects.create(
-            label="Test",
-            time=dt_time(8, 0),
-            insulin_type=insulin_type,
-            units=10.0
-        )
+        schedule = make_schedule(insulin_type)
         
         data = {
             "label": "Test",
@@ -2059,7 +1887,7 @@ class TestInsulinScheduleEditView:
             "units": "10.0",
         }
         
-        response = client.post(reverse("entries:insulin_schedule_edit", args=[schedule.pk]), data)
+        response = auth_client.post(reverse("entries:insulin_schedule_edit", args=[schedule.pk]), data)
         assert response.status_code == 302
         
         schedule.refresh_from_db()
@@ -2072,74 +1900,75 @@ class TestCorrectionScalesListView:
 
     def test_view_requires_authentication(self, client):
         """Test that the view requires authentication."""
-        response = client.get(reverse("entries:correction_scales_list"))
+        response = client.get(SCALES_LIST_URL)
         # Should redirect to login
         assert response.status_code == 302
         assert "/accounts/login/" in response.url
 
-    def test_view_with_authenticated_user(self, client, user):
+    def test_view_with_authenticated_user(self, auth_client):
         """Test that authenticated users can access the view."""
-        client.force_login(user)
-        response = client.get(reverse("entries:correction_scales_list"))
+        response = auth_client.get(SCALES_LIST_URL)
         assert response.status_code == 200
-        assert "entries/correction_scales_list.html" in [t.name for t in response.templates]
+        assert rendered(response, "entries/correction_scales_list.html")
 
-    def test_pagination_default_page_size(self, client, user):
+    def test_pagination_default_page_size(self, auth_client, django_assert_num_queries):
         """Test that default page size is 50."""
-        client.force_login(user)
-        
         # Create 75 correction scale entries
-        for i in range(75):
-            CorrectionScale.objects.create(
-                greater_than=Decimal(f"{5 + i * 0.1:.1f}"),
-                units_to_add=Decimal("1.0")
-            )
-        
-        response = client.get(reverse("entries:correction_scales_list"))
+        scales = CorrectionScale.objects.bulk_create(
+            [
+                CorrectionScale(
+                    greater_than=D_5_0 + Decimal(i) / 10,
+                    units_to_add=D_1_0
+                )
+                for i in range(75)
+            ],
+            batch_size=500,
+        )
+        
+        # User, count and page
+        with django_assert_num_queries(3):
+            response = auth_client.get(SCALES_LIST_URL)
         assert response.status_code == 200
-        assert len(response.context["page_obj"]) == 50
+        assert [scale.pk for scale in response.context["page_obj"]] == [scale.pk for scale in scales[:50]]
         assert response.context["page_size"] == 50
 
-    def test_pagination_custom_page_size(self, client, user):
+    @pytest.mark.parametrize("page_size,expected", [(10, 10), (25, 25), (50, 30), (100, 30)])
+    def test_pagination_custom_page_size(self, auth_client, page_size, expected):
         """Test custom page sizes."""
-        client.force_login(user)
-        
         # Create 30 entries
-        for i in range(30):
-            CorrectionScale.objects.create(
-                greater_than=Decimal(f"{5 + i * 0.1:.1f}"),
-                units_to_add=Decimal("1.0")
-            )
-        
-        for page_size in [10, 25, 50, 100]:
-            response = client.get(
-                reverse("entries:correction_scales_list"),
-                {"page_size": page_size}
-            )
-            assert response.status_code == 200
-            expected_items = min(page_size, 30)
-            assert len(response.context["page_obj"]) == expected_items
-            assert response.context["page_size"] == page_size
+        CorrectionScale.objects.bulk_create(
+            [
+                CorrectionScale(
+                    greater_than=D_5_0 + Decimal(i) / 10,
+                    units_to_add=D_1_0
+                )
+                for i in range(30)
+            ],
+            batch_size=500,
+        )
+        
+        response = auth_client.get(SCALES_LIST_URL, {"page_size": page_size})
+        assert response.status_code == 200
+        assert len(response.context["page_obj"]) == expected
+        assert response.context["page_size"] == page_size
 
-    def test_scales_ordered_by_threshold(self, client, user):
+    def test_scales_ordered_by_threshold(self, auth_client):
         """Test that scales are ordered by greater_than threshold."""
-        client.force_login(user)
-        
         # Create scales in random order
         scale3 = CorrectionScale.objects.create(
-            greater_than=Decimal("12.0"),
+            greater_than=D_12_0,
             units_to_add=Decimal("3.0")
         )
         scale1 = CorrectionScale.objects.create(
-            greater_than=Decimal("8.0"),
-            units_to_add=Decimal("1.0")
+            greater_than=D_8_0,
+            units_to_add=D_1_0
         )
         scale2 = CorrectionScale.objects.create(
-            greater_than=Decimal("10.0"),
-            units_to_add=Decimal("2.0")
+            greater_than=D_10_0,
+            units_to_add=D_2_0
         )
         
-        response = client.get(reverse("entries:correction_scales_list"))
+        response = auth_client.get(SCALES_LIST_URL)
         scales = list(response.context["page_obj"])
         
         # Should be ordered by greater_than (ascending)
@@ -2147,14 +1976,12 @@ class TestCorrectionScalesListView:
         assert scales[1] == scale2  # 10.0
         assert scales[2] == scale3  # 12.0
 
-    def test_empty_list_displays_message(self, client, user):
+    def test_empty_list_displays_message(self, auth_client):
         """Test that empty list displays appropriate message."""
-        client.force_login(user)
-        
-        response = client.get(reverse("entries:correction_scales_list"))
+        response = auth_client.get(SCALES_LIST_URL)
         assert response.status_code == 200
         # Check for empty state in the response
-        assert "No correction scale entries found" in response.content.decode()
+        assert b"No correction scale entries found" in response.content
 
 
 @pytest.mark.django_db
@@ -2163,49 +1990,42 @@ class TestCorrectionScaleCreateView:
 
     def test_view_requires_authentication(self, client):
         """Test that the view requires authentication."""
-        response = client.get(reverse("entries:correction_scale_create"))
+        response = client.get(SCALE_CREATE_URL)
         # Should redirect to login
         assert response.status_code == 302
         assert "/accounts/login/" in response.url
 
-    def test_view_with_authenticated_user(self, client, user):
+    def test_view_with_authenticated_user(self, auth_client):
         """Test that authenticated users can access the view."""
-        client.force_login(user)
-        response = client.get(reverse("entries:correction_scale_create"))
+        response = auth_client.get(SCALE_CREATE_URL)
         assert response.status_code == 200
-        assert "entries/correction_scale_form.html" in [t.name for t in response.templates]
+        assert rendered(response, "entries/correction_scale_form.html")
 
-    def test_create_correction_scale_with_valid_data(self, client, user):
+    def test_create_correction_scale_with_valid_data(self, auth_client):
         """Test creating a correction scale entry with valid data."""
-        client.force_login(user)
-        
         data = {
             "greater_than": "8.5",
             "units_to_add": "2.0",
         }
         
-        response = client.post(reverse("entries:correction_scale_create"), data)
+        response = auth_client.post(SCALE_CREATE_URL, data)
         
         # Should redirect to list view
-        assert response.status_code == 302
-        assert response.url == reverse("entries:correction_scales_list")
+        assert_redirects_to(response, SCALES_LIST_URL)
         
         # Verify the entry was created
-        assert CorrectionScale.objects.count() == 1
-        scale = CorrectionScale.objects.first()
+        scale = sole(CorrectionScale.objects.all())
         assert scale.greater_than == Decimal("8.5")
-        assert scale.units_to_add == Decimal("2.0")
+        assert scale.units_to_add == D_2_0
 
-    def test_create_correction_scale_with_invalid_data(self, client, user):
+    def test_create_correction_scale_with_invalid_data(self, auth_client):
         """Test creating a correction scale with invalid data."""
-        client.force_login(user)
-        
         data = {
             "greater_than": "invalid",
             "units_to_add": "2.0",
         }
         
-        response = client.post(reverse("entries:correction_scale_create"), data)
+        response = auth_client.post(SCALE_CREATE_URL, data)
         
         # Should not redirect (form has errors)
         assert response.status_code == 200
@@ -2215,16 +2035,14 @@ class TestCorrectionScaleCreateView:
         # Verify no entry was created
         assert CorrectionScale.objects.count() == 0
 
-    def test_create_correction_scale_with_missing_fields(self, client, user):
+    def test_create_correction_scale_with_missing_fields(self, auth_client):
         """Test creating a correction scale with missing required fields."""
-        client.force_login(user)
-        
         data = {
             "greater_than": "8.5",
             # Missing units_to_add
         }
         
-        response = client.post(reverse("entries:correction_scale_create"), data)
+        response = auth_client.post(SCALE_CREATE_URL, data)
         
         # Should not redirect (form has errors)
         assert response.status_code == 200
@@ -2242,8 +2060,8 @@ class TestCorrectionScaleEditView:
     def test_view_requires_authentication(self, client):
         """Test that the view requires authentication."""
         scale = CorrectionScale.objects.create(
-            greater_than=Decimal("8.0"),
-            units_to_add=Decimal("2.0")
+            greater_than=D_8_0,
+            units_to_add=D_2_0
         )
         
         response = client.get(reverse("entries:correction_scale_edit", args=[scale.pk]))
@@ -2251,26 +2069,22 @@ class TestCorrectionScaleEditView:
         assert response.status_code == 302
         assert "/accounts/login/" in response.url
 
-    def test_view_with_authenticated_user(self, client, user):
+    def test_view_with_authenticated_user(self, auth_client):
         """Test that authenticated users can access the view."""
-        client.force_login(user)
-        
         scale = CorrectionScale.objects.create(
-            greater_than=Decimal("8.0"),
-            units_to_add=Decimal("2.0")
+            greater_than=D_8_0,
+            units_to_add=D_2_0
         )
         
-        response = client.get(reverse("entries:correction_scale_edit", args=[scale.pk]))
+        response = auth_client.get(reverse("entries:correction_scale_edit", args=[scale.pk]))
         assert response.status_code == 200
-        assert "entries/correction_scale_form.html" in [t.name for t in response.templates]
+        assert rendered(response, "entries/correction_scale_form.html")
 
-    def test_edit_correction_scale_with_valid_data(self, client, user):
+    def test_edit_correction_scale_with_valid_data(self, auth_client):
         """Test editing a correction scale with valid data."""
-        client.force_login(user)
-        
         scale = CorrectionScale.objects.create(
-            greater_than=Decimal("8.0"),
-            units_to_add=Decimal("2.0")
+            greater_than=D_8_0,
+            units_to_add=D_2_0
         )
         
         data = {
@@ -2278,24 +2092,21 @@ class TestCorrectionScaleEditView:
             "units_to_add": "3.0",
         }
         
-        response = client.post(reverse("entries:correction_scale_edit", args=[scale.pk]), data)
+        response = auth_client.post(reverse("entries:correction_scale_edit", args=[scale.pk]), data)
         
         # Should redirect to list view
-        assert response.status_code == 302
-        assert response.url == reverse("entries:correction_scales_list")
+        assert_redirects_to(response, SCALES_LIST_URL)
         
         # Verify the entry was updated
         scale.refresh_from_db()
         assert scale.greater_than == Decimal("9.5")
         assert scale.units_to_add == Decimal("3.0")
 
-    def test_edit_correction_scale_with_invalid_data(self, client, user):
+    def test_edit_correction_scale_with_invalid_data(self, auth_client):
         """Test editing a correction scale with invalid data."""
-        client.force_login(user)
-        
         scale = CorrectionScale.objects.create(
-            greater_than=Decimal("8.0"),
-            units_to_add=Decimal("2.0")
+            greater_than=D_8_0,
+            units_to_add=D_2_0
         )
         
         data = {
@@ -2303,7 +2114,7 @@ class TestCorrectionScaleEditView:
             "units_to_add": "2.0",
         }
         
-        response = client.post(reverse("entries:correction_scale_edit", args=[scale.pk]), data)
+        response = auth_client.post(reverse("entries:correction_scale_edit", args=[scale.pk]), data)
         
         # Should not redirect (form has errors)
         assert response.status_code == 200
@@ -2312,31 +2123,25 @@ class TestCorrectionScaleEditView:
         
         # Verify the entry was not updated
         scale.refresh_from_db()
-        assert scale.greater_than == Decimal("8.0")
+        assert scale.greater_than == D_8_0
 
-    def test_edit_nonexistent_scale_returns_404(self, client, user):
+    def test_edit_nonexistent_scale_returns_404(self, auth_client):
         """Test editing a non-existent correction scale returns 404."""
-        from uuid import uuid4
-        client.force_login(user)
-        
         # Try to access a non-existent scale
-        fake_uuid = uuid4()
-        response = client.get(reverse("entries:correction_scale_edit", args=[fake_uuid]))
+        response = auth_client.get(reverse("entries:correction_scale_edit", args=[NONEXISTENT_PK]))
         
         assert response.status_code == 404
 
-    def test_form_prepopulated_with_scale_data(self, client, user):
+    def test_form_prepopulated_with_scale_data(self, auth_client):
         """Test that form is prepopulated with existing scale data."""
-        client.force_login(user)
-        
         scale = CorrectionScale.objects.create(
-            greater_than=Decimal("10.5"),
+            greater_than=D_10_5,
             units_to_add=Decimal("2.5")
         )
         
-        response = client.get(reverse("entries:correction_scale_edit", args=[scale.pk]))
+        response = auth_client.get(reverse("entries:correction_scale_edit", args=[scale.pk]))
         
         assert response.status_code == 200
         form = response.context["form"]
-        assert form.initial["greater_than"] == Decimal("10.5")
+        assert form.initial["greater_than"] == D_10_5
         assert form.initial["units_to_add"] == Decimal("2.5")
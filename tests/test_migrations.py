@@ -0,0 +1,14 @@
+"""Tests for database migrations."""
+import pytest
+from django.core.management import call_command
+
+
+@pytest.mark.django_db
+def test_no_missing_migrations(settings):
+    """Test that models and migrations are in sync.
+
+    The suite runs with --nomigrations, building tables from the models, so
+    this guards against model changes that were never migrated.
+    """
+    settings.MIGRATION_MODULES = {}
+    call_command('makemigrations', '--check', '--dry-run', verbosity=0)
@@ -38,18 +38,6 @@ class TestUserModel:
         assert user.is_staff is True
         assert user.is_superuser is True
 
-    def test_user_str_representation(self, user):
-        """Test user string representation."""
-        assert str(user) == user.email
-
-    def test_get_full_name(self, user):
-        """Test get_full_name method."""
-        assert user.get_full_name() == f'{user.first_name} {user.last_name}'
-
-    def test_get_short_name(self, user):
-        """Test get_short_name method."""
-        assert user.get_short_name() == user.first_name
-
     def test_user_email_normalization(self):
         """Test that email is normalized."""
         user = User.objects.create_user(  # type: ignore[call-arg]
@@ -71,20 +59,34 @@ class TestUserModel:
         assert user.first_name == 'Test'
         assert user.last_name == 'User'
 
-    def test_superuser_must_have_is_staff(self):
-        """Test that creating a superuser with is_staff=False raises ValueError."""
-        with pytest.raises(ValueError, match='Superuser must have is_staff=True'):
+    @pytest.mark.parametrize(
+        'kwargs,msg',
+        [
+            ({'is_staff': False}, 'Superuser must have is_staff=True'),
+            ({'is_superuser': False}, 'Superuser must have is_superuser=True'),
+        ],
+    )
+    def test_superuser_flag_validation(self, kwargs, msg):
+        """Test that creating a superuser with a false flag raises ValueError."""
+        with pytest.raises(ValueError, match=msg):
             User.objects.create_superuser(  # type: ignore[call-arg]
                 email='admin@example.com',
                 password='adminpass123',
-                is_staff=False,
+                **kwargs,
             )
 
-    def test_superuser_must_have_is_superuser(self):
-        """Test that creating a superuser with is_superuser=False raises ValueError."""
-        with pytest.raises(ValueError, match='Superuser must have is_superuser=True'):
-            User.objects.create_superuser(  # type: ignore[call-arg]
-                email='admin@example.com',
-                password='adminpass123',
-                is_superuser=False,
-            )
+
+class TestUserModelMethods:
+    """Tests for User methods that don't need the database."""
+
+    def test_user_str_representation(self, unsaved_user):
+        """Test user string representation."""
+        assert str(unsaved_user) == unsaved_user.email
+
+    def test_get_full_name(self, unsaved_user):
+        """Test get_full_name method."""
+        assert unsaved_user.get_full_name() == f'{unsaved_user.first_name} {unsaved_user.last_name}'
+
+    def test_get_short_name(self, unsaved_user):
+        """Test get_short_name method."""
+        assert unsaved_user.get_short_name() == unsaved_user.first_name